@@ -3,19 +3,21 @@ Authentication Controller - Handles user authentication endpoints
 """
 
 from typing import Optional
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, status, BackgroundTasks
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, EmailStr
 from app.models.user import User, EmploymentType
-from datetime import datetime, timedelta
+from app.controllers.user_controller import invalidate_user_cache
+from app.utils.sessions import cached_session_user, cache_session_user, evict_user_sessions
+from app.utils.passwords import hash_password
+from datetime import timedelta
+from app.utils.clock import utcnow
 import jwt
-from passlib.context import CryptContext
 
 auth_router = APIRouter(tags=["authentication"])
 
 # Security
 security = HTTPBearer()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # JWT settings (should be in config)
 SECRET_KEY = "your-secret-key-change-this"
@@ -43,6 +45,12 @@ class Token(BaseModel):
     access_token: str
     token_type: str
 
+async def _record_login(user: User):
+    """Persist the last-login timestamp outside the request's critical path"""
+    await user.set({"last_login": utcnow()})
+    invalidate_user_cache(str(user.id))
+    evict_user_sessions(str(user.id))
+
 @auth_router.post("/register", response_model=dict)
 async def register(user_data: UserRegister):
     """Register a new user"""
@@ -64,7 +72,7 @@ async def register(user_data: UserRegister):
             )
     
     # Hash password
-    password_hash = pwd_context.hash(user_data.password)
+    password_hash = await hash_password(user_data.password)
     
     # Create user
     user = User(
@@ -75,15 +83,16 @@ async def register(user_data: UserRegister):
         employment_type=user_data.employment_type,
         username=user_data.username or user_data.email.split('@')[0],
         is_active=True,
-        created_at=datetime.utcnow()
+        created_at=utcnow()
     )
     
     await user.insert()
+    invalidate_user_cache()
     
     return {"message": "User registered successfully", "user_id": str(user.id)}
 
 @auth_router.post("/login", response_model=Token)
-async def login(user_credentials: UserLogin):
+async def login(user_credentials: UserLogin, background_tasks: BackgroundTasks):
     """Authenticate user and return JWT token"""
     # Find user by email
     user = await User.find_one({"email": user_credentials.email})
@@ -102,9 +111,8 @@ async def login(user_credentials: UserLogin):
             detail="Account is disabled",
         )
     
-    # Update last login
-    user.last_login = datetime.utcnow()
-    await user.save()
+    # Record last login after the response is sent
+    background_tasks.add_task(_record_login, user)
     
     # Create JWT token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -116,7 +124,7 @@ async def login(user_credentials: UserLogin):
     return {"access_token": access_token, "token_type": "bearer"}
 
 @auth_router.post("/login-username", response_model=Token)
-async def login_username(user_credentials: UserLoginByUsername):
+async def login_username(user_credentials: UserLoginByUsername, background_tasks: BackgroundTasks):
     """Authenticate user by username and return JWT token"""
     # Find user by username  
     user = await User.find_one({"username": user_credentials.username})
@@ -135,9 +143,8 @@ async def login_username(user_credentials: UserLoginByUsername):
             detail="Account is disabled",
         )
     
-    # Update last login
-    user.last_login = datetime.utcnow()
-    await user.save()
+    # Record last login after the response is sent
+    background_tasks.add_task(_record_login, user)
     
     # Create JWT token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -152,15 +159,20 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
+        expire = utcnow() + timedelta(minutes=15)
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Get current authenticated user"""
+    token = credentials.credentials
+    user = cached_session_user(token)
+    if user is not None:
+        return user
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -168,7 +180,7 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     )
     
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
@@ -178,4 +190,6 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     user = await User.find_one({"email": email})
     if user is None:
         raise credentials_exception
+    # Only verified tokens that resolve to a user are cached
+    cache_session_user(token, user, payload.get("exp"))
     return user
\ No newline at end of file
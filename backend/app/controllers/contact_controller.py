@@ -43,7 +43,7 @@ class ContactUpdate(BaseModel):
 async def create_contact(contact_data: ContactCreate):
     """Create a new contact"""
     try:
-        contact = Contact(**contact_data.dict())
+        contact = Contact(**contact_data.model_dump())
         await contact.insert()
         return contact
     except Exception as e:
@@ -61,7 +61,7 @@ async def get_contacts(
         if organisation:
             query["organisation"] = organisation
             
-        contacts = await Contact.find(query).skip(skip).limit(limit).to_list()
+        contacts = await Contact.find(query).skip(skip).limit(limit).to_list(length=limit)
         return contacts
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -85,7 +85,7 @@ async def update_contact(contact_id: str, contact_data: ContactUpdate):
         if not contact:
             raise HTTPException(status_code=404, detail="Contact not found")
             
-        update_data = contact_data.dict(exclude_unset=True)
+        update_data = contact_data.model_dump(exclude_unset=True)
         await contact.update({"$set": update_data})
         return contact
     except Exception as e:
@@ -111,13 +111,6 @@ async def search_contacts(
 ):
     """Search contacts by name or organisation"""
     try:
-        contacts = await Contact.find({
-            "$or": [
-                {"name": {"$regex": q, "$options": "i"}},
-                {"organisation": {"$regex": q, "$options": "i"}},
-                {"email": {"$regex": q, "$options": "i"}}
-            ]
-        }).limit(limit).to_list()
-        return contacts
+        return await ContactService().search_contacts(q, limit)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
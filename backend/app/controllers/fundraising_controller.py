@@ -8,6 +8,7 @@ from pydantic import BaseModel
 from app.models.fundraising import Fundraising, FundraisingStatus, InvestorType
 from beanie import PydanticObjectId
 from datetime import datetime
+from app.utils.clock import utcnow
 
 fundraising_router = APIRouter(tags=["fundraising"])
 
@@ -61,10 +62,11 @@ class FundraisingUpdate(BaseModel):
 async def create_fundraising_campaign(campaign_data: FundraisingCreate):
     """Create a new fundraising campaign"""
     try:
+        now = utcnow()
         campaign = Fundraising(
             **campaign_data.model_dump(),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         )
         await campaign.create()
         return {"message": "Fundraising campaign created successfully", "id": str(campaign.id)}
@@ -86,7 +88,7 @@ async def get_all_campaigns(
         if organisation:
             query["organisation"] = {"$regex": organisation, "$options": "i"}
         
-        campaigns = await Fundraising.find(query).skip(skip).limit(limit).to_list()
+        campaigns = await Fundraising.find(query).sort("-created_at").skip(skip).limit(limit).to_list(length=limit)
         
         # Convert to response format
         response = []
@@ -165,7 +167,7 @@ async def update_campaign(campaign_id: str, update_data: FundraisingUpdate):
         if not campaign:
             raise HTTPException(status_code=404, detail="Campaign not found")
         
-        update_dict = update_data.dict(exclude_unset=True)
+        update_dict = update_data.model_dump(exclude_unset=True)
         if update_dict:
             for field, value in update_dict.items():
                 setattr(campaign, field, value)
@@ -191,28 +193,8 @@ async def delete_campaign(campaign_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting campaign: {str(e)}")
 
-@fundraising_router.post("/", response_model=dict)
-async def create_campaign(campaign_data: FundraisingCreate):
-    """Create a new fundraising campaign"""
-    try:
-        campaign = Fundraising(**campaign_data.dict())
-        await campaign.save()
-        return {"message": "Campaign created successfully", "id": str(campaign.id)}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error creating campaign: {str(e)}")
-
-@fundraising_router.delete("/{campaign_id}", response_model=dict)
-async def delete_campaign(campaign_id: PydanticObjectId):
-    """Delete a fundraising campaign"""
-    campaign = await Fundraising.get(campaign_id)
-    if not campaign:
-        raise HTTPException(status_code=404, detail="Campaign not found")
-    
-    await campaign.delete()
-    return {"message": "Campaign deleted successfully"}
-
 @fundraising_router.get("/status/{status}", response_model=List[dict])
 async def get_campaigns_by_status(status: FundraisingStatus):
     """Get campaigns by status"""
-    campaigns = await Fundraising.find({"status_open_closed": status}).to_list()
-    return [campaign.dict() for campaign in campaigns]
\ No newline at end of file
+    campaigns = await Fundraising.find({"status_open_closed": status}).sort("-created_at").to_list()
+    return [campaign.model_dump() for campaign in campaigns]
\ No newline at end of file
@@ -2,24 +2,62 @@
 Meeting Controller - Handles meeting management and audio recording functionality
 """
 
+import logging
 import os
 import uuid
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, status, Header, Response
-from fastapi.responses import FileResponse
-from pydantic import BaseModel
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, UploadFile, File, Form, status, Header, Response
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime
+from app.utils.clock import utcnow
 import aiofiles
+import orjson
 
 from app.models.meeting import Meeting, MeetingType, MeetingStatus, AudioProcessingStatus, MeetingAttendee
 from app.models.fundraising import Fundraising
 from app.models.contact import Contact
 from app.models.user import User
 from app.controllers.auth_controller import get_current_user
-from app.services.audio_processing_service import AudioProcessingService
+from app.services.audio_processing_service import AudioProcessingService, get_audio_service
 
 meeting_router = APIRouter(tags=["meetings"])
 
+logger = logging.getLogger(__name__)
+
+
+def request_audio_service(
+    x_openai_api_key: Optional[str] = Header(default=None, alias="X-OpenAI-API-Key")
+) -> AudioProcessingService:
+    """Audio service for the request, keyed by the caller's OpenAI key when one is sent"""
+    if x_openai_api_key:
+        return AudioProcessingService(api_key=x_openai_api_key)
+    return get_audio_service()
+
+
+# Serializes meeting details, nested attendees and recording included, in pydantic-core
+_MEETING_DETAIL_ADAPTER = TypeAdapter(dict)
+
+# Campaign meeting lists only need summary fields; projecting in Mongo keeps
+# transcripts and AI insights off the wire
+_MEETING_LIST_PROJECTION = {
+    "$project": {
+        "_id": 0,
+        "id": {"$toString": "$_id"},
+        "title": 1,
+        "meeting_type": 1,
+        "status": 1,
+        "scheduled_date": 1,
+        "actual_date": {"$ifNull": ["$actual_date", None]},
+        "duration_minutes": {"$ifNull": ["$duration_minutes", None]},
+        "location": {"$ifNull": ["$location", None]},
+        "is_virtual": {"$ifNull": ["$is_virtual", False]},
+        "has_audio": {"$ne": [{"$ifNull": ["$audio_recording", None]}, None]},
+        "audio_processing_status": {"$ifNull": ["$audio_recording.processing_status", None]},
+        "created_at": 1
+    }
+}
+
 # Audio upload configuration
 UPLOAD_DIR = "uploads/audio"
 ALLOWED_AUDIO_TYPES = [
@@ -125,25 +163,12 @@ async def get_meetings_by_fundraising(
             detail="Fundraising campaign not found"
         )
 
-    meetings = await Meeting.find({"fundraising_id": fundraising_id}).sort([("scheduled_date", -1)]).to_list()
-
-    return [
-        {
-            "id": str(meeting.id),
-            "title": meeting.title,
-            "meeting_type": meeting.meeting_type,
-            "status": meeting.status,
-            "scheduled_date": meeting.scheduled_date,
-            "actual_date": meeting.actual_date,
-            "duration_minutes": meeting.duration_minutes,
-            "location": meeting.location,
-            "is_virtual": meeting.is_virtual,
-            "has_audio": meeting.audio_recording is not None,
-            "audio_processing_status": meeting.audio_recording.processing_status if meeting.audio_recording else None,
-            "created_at": meeting.created_at
-        }
-        for meeting in meetings
-    ]
+    meetings = await Meeting.aggregate([
+        {"$match": {"fundraising_id": fundraising_id}},
+        {"$sort": {"scheduled_date": -1}},
+        _MEETING_LIST_PROJECTION
+    ]).to_list()
+    return meetings
 
 @meeting_router.get("/{meeting_id}", response_model=dict)
 async def get_meeting_details(
@@ -163,7 +188,7 @@ async def get_meeting_details(
     fundraising = await Fundraising.get(meeting.fundraising_id)
     contact = await Contact.get(meeting.contact_id) if meeting.contact_id else None
 
-    return {
+    details = {
         "meeting": meeting,
         "fundraising": {
             "id": str(fundraising.id),
@@ -179,6 +204,7 @@ async def get_meeting_details(
             "email": contact.email
         } if contact else None
     }
+    return Response(content=_MEETING_DETAIL_ADAPTER.dump_json(details, by_alias=True), media_type="application/json")
 
 @meeting_router.put("/{meeting_id}", response_model=dict)
 async def update_meeting(
@@ -200,7 +226,7 @@ async def update_meeting(
     for field, value in update_dict.items():
         setattr(meeting, field, value)
 
-    meeting.updated_at = datetime.utcnow()
+    meeting.updated_at = utcnow()
     await meeting.save()
 
     return {
@@ -259,7 +285,7 @@ async def upload_audio_recording(
         file_size=file_size,
         processing_status=AudioProcessingStatus.NOT_STARTED
     )
-    meeting.updated_at = datetime.utcnow()
+    meeting.updated_at = utcnow()
     await meeting.save()
 
     return {
@@ -333,14 +359,28 @@ async def delete_meeting(
 
     return {"message": "Meeting deleted successfully"}
 
+async def _process_audio_in_background(service: AudioProcessingService, meeting_id: str, meeting: Meeting):
+    """Run audio processing after the response is sent; failures are recorded on the meeting"""
+    try:
+        # The endpoint already marked the recording as processing before queueing this
+        await service.process_audio_recording(meeting_id, meeting=meeting, mark_processing=False)
+    except Exception:
+        logger.exception(f"Background audio processing failed for meeting {meeting_id}")
+
 @meeting_router.post("/{meeting_id}/process-audio", response_model=dict)
 async def process_meeting_audio(
     meeting_id: str,
-    x_openai_api_key: Optional[str] = Header(default=None, alias="X-OpenAI-API-Key"),
+    background_tasks: BackgroundTasks,
+    service: AudioProcessingService = Depends(request_audio_service),
     force: bool = False,
+    background: bool = False,
     current_user: User = Depends(get_current_user)
 ):
-    """Trigger audio-to-text and AI analysis for a meeting's recording"""
+    """
+    Trigger audio-to-text and AI analysis for a meeting's recording.
+    With background=true the call returns immediately; poll the meeting's
+    audio processing status for the outcome.
+    """
 
     meeting = await Meeting.get(meeting_id)
     if not meeting:
@@ -349,9 +389,17 @@ async def process_meeting_audio(
     if not meeting.audio_recording:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No audio recording to process")
 
-    service = AudioProcessingService(api_key=x_openai_api_key)
+    if background:
+        await meeting.set({"audio_recording.processing_status": AudioProcessingStatus.PROCESSING})
+        background_tasks.add_task(_process_audio_in_background, service, meeting_id, meeting)
+        return {
+            "message": "Audio processing started",
+            "status": "processing",
+            "meeting_id": meeting_id
+        }
+
     try:
-        result = await service.process_audio_recording(meeting_id)
+        result = await service.process_audio_recording(meeting_id, meeting=meeting)
         return {"message": "Audio processed successfully", **result}
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
@@ -383,14 +431,34 @@ class CustomPromptRequest(BaseModel):
 async def generate_custom_prompt(
     meeting_id: str,
     request: CustomPromptRequest,
-    x_openai_api_key: Optional[str] = Header(default=None, alias="X-OpenAI-API-Key"),
+    service: AudioProcessingService = Depends(request_audio_service),
     current_user: User = Depends(get_current_user)
 ):
     """Run a custom prompt against the meeting transcript"""
 
-    service = AudioProcessingService(api_key=x_openai_api_key)
     try:
         result = await service.generate_meeting_insights(meeting_id, request.prompt)
         return {"message": "Prompt processed", **result}
     except Exception as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@meeting_router.post("/{meeting_id}/prompt/stream")
+async def stream_custom_prompt(
+    meeting_id: str,
+    request: CustomPromptRequest,
+    service: AudioProcessingService = Depends(request_audio_service),
+    current_user: User = Depends(get_current_user)
+):
+    """Run a custom prompt against the meeting transcript, streaming the answer as server-sent events"""
+
+    try:
+        deltas = await service.stream_meeting_insights(meeting_id, request.prompt)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def events():
+        async for delta in deltas:
+            yield b"data: " + orjson.dumps(delta) + b"\n\n"
+        yield b"data: [DONE]\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
@@ -43,8 +43,8 @@ async def get_all_opportunities(
     limit: int = Query(100, ge=1, le=1000)
 ):
     """Get all investment opportunities"""
-    opportunities = await Opportunity.find_all().skip(skip).limit(limit).to_list()
-    return [opportunity.dict() for opportunity in opportunities]
+    docs = await Opportunity.aggregate([{"$skip": skip}, {"$limit": limit}]).to_list(length=limit)
+    return [Opportunity.from_mongo(doc).model_dump() for doc in docs]
 
 @opportunity_router.get("/{opportunity_id}", response_model=dict)
 async def get_opportunity(opportunity_id: PydanticObjectId):
@@ -81,5 +81,5 @@ async def delete_opportunity(opportunity_id: PydanticObjectId):
 @opportunity_router.get("/sector/{sector}", response_model=List[dict])
 async def get_opportunities_by_sector(sector: str):
     """Get opportunities by sector"""
-    opportunities = await Opportunity.find({"sector": sector}).to_list()
-    return [opportunity.dict() for opportunity in opportunities]
\ No newline at end of file
+    docs = await Opportunity.aggregate([{"$match": {"sector": sector}}]).to_list()
+    return [Opportunity.from_mongo(doc).model_dump() for doc in docs]
\ No newline at end of file
@@ -3,13 +3,15 @@ Organization Controller for Lead Management System
 Handles CRUD operations for organizations
 """
 
+import re
 from typing import List, Optional
-from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 from beanie import PydanticObjectId
 
 from ..models.organization import Organization, IndustryType, OrganizationStatus
+from ..utils.clock import utcnow
 
 
 # Request/Response models
@@ -66,12 +68,52 @@ class OrganizationResponse(BaseModel):
 # Create router
 organization_router = APIRouter(tags=["organizations"])
 
+# Built once so request bodies validate straight into the document model and
+# responses serialize to JSON bytes inside pydantic-core
+_ORG_ADAPTER = TypeAdapter(Organization)
+_ORG_LIST_ADAPTER = TypeAdapter(List[Organization])
+
+
+def _org_json(organization: Organization) -> bytes:
+    """Encode one organization in the API shape: Mongo "_id", no Beanie revision_id"""
+    return _ORG_ADAPTER.dump_json(organization, by_alias=True, exclude={"revision_id"})
+
+
+def _org_list_json(organizations: List[Organization]) -> bytes:
+    """Encode organizations in the API shape: Mongo "_id", no Beanie revision_id"""
+    return _ORG_LIST_ADAPTER.dump_json(organizations, by_alias=True, exclude={"__all__": {"revision_id"}})
+
+
+def _build_organization_query(
+    industry: Optional[IndustryType],
+    status: Optional[OrganizationStatus],
+    country: Optional[str],
+    search: Optional[str]
+) -> dict:
+    """Build the MongoDB filter shared by the list and stream endpoints"""
+    query = {}
+    if industry:
+        query["industry"] = industry
+    if status:
+        query["status"] = status
+    if country:
+        query["country"] = {"$regex": re.escape(country), "$options": "i"}
+    if search:
+        # Escape user input so it matches literally as a substring
+        safe_search = re.escape(search)
+        query["$or"] = [
+            {"name": {"$regex": safe_search, "$options": "i"}},
+            {"description": {"$regex": safe_search, "$options": "i"}},
+            {"city": {"$regex": safe_search, "$options": "i"}}
+        ]
+    return query
+
 
 @organization_router.post("/", response_model=OrganizationResponse)
 async def create_organization(organization: OrganizationCreate):
     """Create a new organization"""
     try:
-        org_doc = Organization(**organization.dict())
+        org_doc = _ORG_ADAPTER.validate_python(organization.model_dump(exclude_unset=True))
         await org_doc.insert()
         return OrganizationResponse(message="Organization created successfully", id=str(org_doc.id))
     except Exception as e:
@@ -89,28 +131,39 @@ async def get_all_organizations(
 ):
     """Get all organizations with optional filtering"""
     try:
-        query = {}
-        
-        # Apply filters
-        if industry:
-            query["industry"] = industry
-        if status:
-            query["status"] = status
-        if country:
-            query["country"] = {"$regex": country, "$options": "i"}
-        if search:
-            query["$or"] = [
-                {"name": {"$regex": search, "$options": "i"}},
-                {"description": {"$regex": search, "$options": "i"}},
-                {"city": {"$regex": search, "$options": "i"}}
-            ]
-        
-        organizations = await Organization.find(query).skip(skip).limit(limit).to_list()
-        return organizations
+        query = _build_organization_query(industry, status, country, search)
+        docs = await Organization.aggregate([
+            {"$match": query},
+            {"$skip": skip},
+            {"$limit": limit}
+        ]).to_list(length=limit)
+        organizations = [Organization.from_mongo(doc) for doc in docs]
+        return Response(content=_org_list_json(organizations), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching organizations: {str(e)}")
 
 
+@organization_router.get("/stream", response_model=List[Organization])
+async def stream_organizations(
+    industry: Optional[IndustryType] = Query(None, description="Filter by industry"),
+    status: Optional[OrganizationStatus] = Query(None, description="Filter by status"),
+    country: Optional[str] = Query(None, description="Filter by country"),
+    search: Optional[str] = Query(None, description="Search in name, description, or city")
+):
+    """Stream all matching organizations as a JSON array (for large exports)"""
+    query = _build_organization_query(industry, status, country, search)
+
+    async def generate():
+        yield b"["
+        first = True
+        async for doc in Organization.aggregate([{"$match": query}]):
+            yield (b"" if first else b",") + _org_json(Organization.from_mongo(doc))
+            first = False
+        yield b"]"
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+
 @organization_router.get("/{organization_id}", response_model=Organization)
 async def get_organization(organization_id: str):
     """Get a specific organization by ID"""
@@ -122,7 +175,7 @@ async def get_organization(organization_id: str):
         if not organization:
             raise HTTPException(status_code=404, detail="Organization not found")
         
-        return organization
+        return Response(content=_org_json(organization), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -141,9 +194,9 @@ async def update_organization(organization_id: str, organization: OrganizationUp
             raise HTTPException(status_code=404, detail="Organization not found")
         
         # Update fields that are provided
-        update_data = organization.dict(exclude_unset=True)
+        update_data = organization.model_dump(exclude_unset=True)
         if update_data:
-            update_data["updated_at"] = datetime.utcnow()
+            update_data["updated_at"] = utcnow()
             await org_doc.update({"$set": update_data})
         
         return OrganizationResponse(message="Organization updated successfully")
@@ -153,19 +206,18 @@ async def update_organization(organization_id: str, organization: OrganizationUp
         raise HTTPException(status_code=500, detail=f"Error updating organization: {str(e)}")
 
 
-@organization_router.delete("/{organization_id}", response_model=OrganizationResponse)
+@organization_router.delete("/{organization_id}", status_code=204, response_class=Response)
 async def delete_organization(organization_id: str):
     """Delete an organization"""
     try:
         if not PydanticObjectId.is_valid(organization_id):
             raise HTTPException(status_code=400, detail="Invalid organization ID format")
         
-        organization = await Organization.get(PydanticObjectId(organization_id))
-        if not organization:
+        result = await Organization.find_one({"_id": PydanticObjectId(organization_id)}).delete()
+        if not result or not result.deleted_count:
             raise HTTPException(status_code=404, detail="Organization not found")
         
-        await organization.delete()
-        return OrganizationResponse(message="Organization deleted successfully")
+        return Response(status_code=204)
     except HTTPException:
         raise
     except Exception as e:
@@ -179,9 +231,11 @@ async def search_organizations_by_name(
 ):
     """Search organizations by name (for autocomplete/lookup)"""
     try:
-        organizations = await Organization.find(
-            {"name": {"$regex": name, "$options": "i"}}
-        ).limit(limit).to_list()
-        return organizations
+        docs = await Organization.aggregate([
+            {"$match": {"name": {"$regex": re.escape(name), "$options": "i"}}},
+            {"$limit": limit}
+        ]).to_list(length=limit)
+        organizations = [Organization.from_mongo(doc) for doc in docs]
+        return Response(content=_org_list_json(organizations), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching organizations: {str(e)}")
\ No newline at end of file
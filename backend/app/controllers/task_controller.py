@@ -3,46 +3,110 @@ Task Controller - Handles task management endpoints
 """
 
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, Query
-from pydantic import BaseModel
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, Body
+from pydantic import BaseModel, TypeAdapter, ValidationError, field_validator
 from app.models.task import Task, TaskStatus, TaskPriority
-from beanie import PydanticObjectId
+from app.utils.responses import ORJSONResponse
+from beanie import PydanticObjectId, BulkWriter
 
 task_router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# Built once so request bodies validate straight into the document model
+_TASK_ADAPTER = TypeAdapter(Task)
+
+# Upper bound on items per bulk request; larger bodies are rejected with 422
+_MAX_BULK_ITEMS = 500
+
 # Request/Response models
 class TaskCreate(BaseModel):
     title: str
     description: Optional[str] = None
-    assignee_id: Optional[str] = None
-    due_date: Optional[str] = None
+    assigned_to: str
+    due_date: Optional[datetime] = None
     priority: TaskPriority = TaskPriority.medium
     tags: List[str] = []
 
 class TaskUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
-    assignee_id: Optional[str] = None
-    due_date: Optional[str] = None
+    assigned_to: Optional[str] = None
+    due_date: Optional[datetime] = None
     priority: Optional[TaskPriority] = None
     status: Optional[TaskStatus] = None
     tags: Optional[List[str]] = None
 
+    @field_validator("title", "assigned_to", "priority", "status", "tags")
+    @classmethod
+    def reject_null(cls, value):
+        """These fields may be left out of a patch but never cleared"""
+        if value is None:
+            raise ValueError("may not be null")
+        return value
+
+class TaskBulkUpdate(BaseModel):
+    id: PydanticObjectId
+    patch: TaskUpdate
+
 @task_router.post("/", response_model=dict)
 async def create_task(task_data: TaskCreate):
     """Create a new task"""
-    task = Task(**task_data.dict())
+    try:
+        task = _TASK_ADAPTER.validate_python(task_data.model_dump(exclude_unset=True))
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     await task.insert()
     return {"message": "Task created successfully", "id": str(task.id)}
 
+@task_router.post("/bulk", response_model=dict)
+async def bulk_create_tasks(items: List[TaskCreate] = Body(..., max_length=_MAX_BULK_ITEMS)):
+    """Create multiple tasks in a single insert"""
+    try:
+        tasks = [_TASK_ADAPTER.validate_python(item.model_dump(exclude_unset=True)) for item in items]
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if not tasks:
+        return {"message": "No tasks to create", "inserted": 0, "ids": []}
+    result = await Task.insert_many(tasks)
+    return {
+        "message": "Tasks created successfully",
+        "inserted": len(result.inserted_ids),
+        "ids": [str(inserted_id) for inserted_id in result.inserted_ids]
+    }
+
+@task_router.put("/bulk", response_model=dict)
+async def bulk_update_tasks(items: List[TaskBulkUpdate] = Body(..., max_length=_MAX_BULK_ITEMS)):
+    """Update multiple tasks in a single bulk write"""
+    bulk_writer = BulkWriter()
+    for item in items:
+        patch = item.patch.model_dump(exclude_unset=True)
+        if patch:
+            await Task.find_one({"_id": item.id}).update({"$set": patch}, bulk_writer=bulk_writer)
+    result = await bulk_writer.commit()
+    return {
+        "message": "Tasks updated successfully",
+        "submitted": len(items),
+        "matched": result.matched_count if result else 0,
+        "modified": result.modified_count if result else 0
+    }
+
 @task_router.get("/", response_model=List[dict])
 async def get_all_tasks(
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000)
+    limit: int = Query(100, ge=1, le=1000),
+    after_id: Optional[PydanticObjectId] = Query(None, description="Return tasks after this ID (keyset pagination); cannot be combined with skip")
 ):
     """Get all tasks"""
-    tasks = await Task.find_all().skip(skip).limit(limit).to_list()
-    return [task.dict() for task in tasks]
+    if after_id and skip:
+        raise HTTPException(status_code=400, detail="Use either skip or after_id, not both")
+    # Keyset pagination walks the _id index instead of re-scanning skipped rows
+    if after_id:
+        pipeline = [{"$match": {"_id": {"$gt": after_id}}}, {"$sort": {"_id": 1}}]
+    else:
+        pipeline = [{"$sort": {"_id": 1}}, {"$skip": skip}]
+    pipeline.append({"$limit": limit})
+    docs = await Task.aggregate(pipeline).to_list(length=limit)
+    return ORJSONResponse([Task.from_mongo(doc).model_dump() for doc in docs])
 
 @task_router.get("/{task_id}", response_model=dict)
 async def get_task(task_id: PydanticObjectId):
@@ -50,7 +114,7 @@ async def get_task(task_id: PydanticObjectId):
     task = await Task.get(task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
-    return task.dict()
+    return ORJSONResponse(task.model_dump())
 
 @task_router.put("/{task_id}", response_model=dict)
 async def update_task(task_id: PydanticObjectId, update_data: TaskUpdate):
@@ -59,31 +123,30 @@ async def update_task(task_id: PydanticObjectId, update_data: TaskUpdate):
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    update_dict = {k: v for k, v in update_data.dict().items() if v is not None}
+    update_dict = update_data.model_dump(exclude_unset=True)
     for key, value in update_dict.items():
         setattr(task, key, value)
     
     await task.save()
     return {"message": "Task updated successfully"}
 
-@task_router.delete("/{task_id}", response_model=dict)
+@task_router.delete("/{task_id}", status_code=204, response_class=Response)
 async def delete_task(task_id: PydanticObjectId):
     """Delete a task"""
-    task = await Task.get(task_id)
-    if not task:
+    result = await Task.find_one({"_id": task_id}).delete()
+    if not result or not result.deleted_count:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    await task.delete()
-    return {"message": "Task deleted successfully"}
+    return Response(status_code=204)
 
 @task_router.get("/status/{status}", response_model=List[dict])
 async def get_tasks_by_status(status: TaskStatus):
     """Get tasks by status"""
-    tasks = await Task.find({"status": status}).to_list()
-    return [task.dict() for task in tasks]
+    docs = await Task.aggregate([{"$match": {"status": status}}]).to_list()
+    return ORJSONResponse([Task.from_mongo(doc).model_dump() for doc in docs])
 
 @task_router.get("/assignee/{assignee_id}", response_model=List[dict])
 async def get_tasks_by_assignee(assignee_id: str):
     """Get tasks by assignee"""
-    tasks = await Task.find({"assignee_id": assignee_id}).to_list()
-    return [task.dict() for task in tasks]
\ No newline at end of file
+    docs = await Task.aggregate([{"$match": {"assigned_to": assignee_id}}]).to_list()
+    return ORJSONResponse([Task.from_mongo(doc).model_dump() for doc in docs])
\ No newline at end of file
@@ -3,41 +3,116 @@ Tracker Controller - Handles tracking and analytics endpoints
 """
 
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, HTTPException, Depends, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, Body
+from pydantic import BaseModel, TypeAdapter, ValidationError, field_validator
 from app.models.tracker import Tracker, TrackerType
-from beanie import PydanticObjectId
+from app.utils.responses import ORJSONResponse
+from beanie import PydanticObjectId, BulkWriter
 
 tracker_router = APIRouter(prefix="/tracker", tags=["tracker"])
 
+# Built once so request bodies validate straight into the document model
+_TRACKER_ADAPTER = TypeAdapter(Tracker)
+
+# Upper bound on items per bulk request; larger bodies are rejected with 422
+_MAX_BULK_ITEMS = 500
+
 # Request/Response models
 class TrackerCreate(BaseModel):
-    name: str
-    tracker_type: TrackerType
-    entity_id: str
-    data: Dict[str, Any]
-    metadata: Optional[Dict[str, Any]] = None
+    title: str
+    category: str
+    tracker_type: Optional[TrackerType] = None
+    entity_id: Optional[str] = None
+    data: Dict[str, Any] = {}
+    contact_id: Optional[str] = None
+    fundraising_id: Optional[str] = None
+    opportunity_id: Optional[str] = None
+    user_id: Optional[str] = None
+    source: Optional[str] = None
+    status: str = "Active"
+    notes: Optional[str] = None
 
 class TrackerUpdate(BaseModel):
-    name: Optional[str] = None
+    title: Optional[str] = None
+    category: Optional[str] = None
+    tracker_type: Optional[TrackerType] = None
+    entity_id: Optional[str] = None
     data: Optional[Dict[str, Any]] = None
-    metadata: Optional[Dict[str, Any]] = None
+    source: Optional[str] = None
+    status: Optional[str] = None
+    notes: Optional[str] = None
+
+    @field_validator("title", "category", "data", "status")
+    @classmethod
+    def reject_null(cls, value):
+        """These fields may be left out of a patch but never cleared"""
+        if value is None:
+            raise ValueError("may not be null")
+        return value
+
+class TrackerBulkUpdate(BaseModel):
+    id: PydanticObjectId
+    patch: TrackerUpdate
 
 @tracker_router.post("/", response_model=dict)
 async def create_tracker_entry(tracker_data: TrackerCreate):
     """Create a new tracker entry"""
-    tracker = Tracker(**tracker_data.dict())
+    try:
+        tracker = _TRACKER_ADAPTER.validate_python(tracker_data.model_dump(exclude_unset=True))
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     await tracker.insert()
     return {"message": "Tracker entry created successfully", "id": str(tracker.id)}
 
+@tracker_router.post("/bulk", response_model=dict)
+async def bulk_create_tracker_entries(items: List[TrackerCreate] = Body(..., max_length=_MAX_BULK_ITEMS)):
+    """Create multiple tracker entries in a single insert"""
+    try:
+        trackers = [_TRACKER_ADAPTER.validate_python(item.model_dump(exclude_unset=True)) for item in items]
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if not trackers:
+        return {"message": "No tracker entries to create", "inserted": 0, "ids": []}
+    result = await Tracker.insert_many(trackers)
+    return {
+        "message": "Tracker entries created successfully",
+        "inserted": len(result.inserted_ids),
+        "ids": [str(inserted_id) for inserted_id in result.inserted_ids]
+    }
+
+@tracker_router.put("/bulk", response_model=dict)
+async def bulk_update_tracker_entries(items: List[TrackerBulkUpdate] = Body(..., max_length=_MAX_BULK_ITEMS)):
+    """Update multiple tracker entries in a single bulk write"""
+    bulk_writer = BulkWriter()
+    for item in items:
+        patch = item.patch.model_dump(exclude_unset=True)
+        if patch:
+            await Tracker.find_one({"_id": item.id}).update({"$set": patch}, bulk_writer=bulk_writer)
+    result = await bulk_writer.commit()
+    return {
+        "message": "Tracker entries updated successfully",
+        "submitted": len(items),
+        "matched": result.matched_count if result else 0,
+        "modified": result.modified_count if result else 0
+    }
+
 @tracker_router.get("/", response_model=List[dict])
 async def get_all_tracker_entries(
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000)
+    limit: int = Query(100, ge=1, le=1000),
+    after_id: Optional[PydanticObjectId] = Query(None, description="Return entries after this ID (keyset pagination); cannot be combined with skip")
 ):
     """Get all tracker entries"""
-    trackers = await Tracker.find_all().skip(skip).limit(limit).to_list()
-    return [tracker.dict() for tracker in trackers]
+    if after_id and skip:
+        raise HTTPException(status_code=400, detail="Use either skip or after_id, not both")
+    # Keyset pagination walks the _id index instead of re-scanning skipped rows
+    if after_id:
+        pipeline = [{"$match": {"_id": {"$gt": after_id}}}, {"$sort": {"_id": 1}}]
+    else:
+        pipeline = [{"$sort": {"_id": 1}}, {"$skip": skip}]
+    pipeline.append({"$limit": limit})
+    docs = await Tracker.aggregate(pipeline).to_list(length=limit)
+    return ORJSONResponse([Tracker.from_mongo(doc).model_dump() for doc in docs])
 
 @tracker_router.get("/{tracker_id}", response_model=dict)
 async def get_tracker_entry(tracker_id: PydanticObjectId):
@@ -45,7 +120,7 @@ async def get_tracker_entry(tracker_id: PydanticObjectId):
     tracker = await Tracker.get(tracker_id)
     if not tracker:
         raise HTTPException(status_code=404, detail="Tracker entry not found")
-    return tracker.dict()
+    return ORJSONResponse(tracker.model_dump())
 
 @tracker_router.put("/{tracker_id}", response_model=dict)
 async def update_tracker_entry(tracker_id: PydanticObjectId, update_data: TrackerUpdate):
@@ -54,31 +129,30 @@ async def update_tracker_entry(tracker_id: PydanticObjectId, update_data: Tracke
     if not tracker:
         raise HTTPException(status_code=404, detail="Tracker entry not found")
     
-    update_dict = {k: v for k, v in update_data.dict().items() if v is not None}
+    update_dict = update_data.model_dump(exclude_unset=True)
     for key, value in update_dict.items():
         setattr(tracker, key, value)
     
     await tracker.save()
     return {"message": "Tracker entry updated successfully"}
 
-@tracker_router.delete("/{tracker_id}", response_model=dict)
+@tracker_router.delete("/{tracker_id}", status_code=204, response_class=Response)
 async def delete_tracker_entry(tracker_id: PydanticObjectId):
     """Delete a tracker entry"""
-    tracker = await Tracker.get(tracker_id)
-    if not tracker:
+    result = await Tracker.find_one({"_id": tracker_id}).delete()
+    if not result or not result.deleted_count:
         raise HTTPException(status_code=404, detail="Tracker entry not found")
     
-    await tracker.delete()
-    return {"message": "Tracker entry deleted successfully"}
+    return Response(status_code=204)
 
 @tracker_router.get("/type/{tracker_type}", response_model=List[dict])
 async def get_trackers_by_type(tracker_type: TrackerType):
     """Get tracker entries by type"""
-    trackers = await Tracker.find({"tracker_type": tracker_type}).to_list()
-    return [tracker.dict() for tracker in trackers]
+    docs = await Tracker.aggregate([{"$match": {"tracker_type": tracker_type}}]).to_list()
+    return ORJSONResponse([Tracker.from_mongo(doc).model_dump() for doc in docs])
 
 @tracker_router.get("/entity/{entity_id}", response_model=List[dict])
 async def get_trackers_by_entity(entity_id: str):
     """Get tracker entries by entity ID"""
-    trackers = await Tracker.find({"entity_id": entity_id}).to_list()
-    return [tracker.dict() for tracker in trackers]
\ No newline at end of file
+    docs = await Tracker.aggregate([{"$match": {"entity_id": entity_id}}]).to_list()
+    return ORJSONResponse([Tracker.from_mongo(doc).model_dump() for doc in docs])
\ No newline at end of file
@@ -2,18 +2,45 @@
 User Controller - Handles user management endpoints
 """
 
+import re
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, EmailStr
 from app.models.user import User, UserRole, EmploymentType
-from beanie import PydanticObjectId
+from app.utils.cache import TTLCache
+from app.utils.config import get_settings
+from app.utils.passwords import hash_password, verify_password
+from app.utils.responses import json_dumps
+from app.utils.sessions import evict_user_sessions
+from bson import ObjectId
 from datetime import datetime
-from passlib.context import CryptContext
+from app.utils.clock import utcnow
 
 user_router = APIRouter(tags=["users"])
 
-# Password management
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 24-hex-digit ObjectId check, compiled once for the per-request ID guard
+_is_object_id = re.compile(r"[0-9a-fA-F]{24}").fullmatch
+
+# Encoded JSON bodies for user reads. Entries are per process: writes through
+# this worker invalidate them at once, but changes made through another worker
+# (role, deactivation, last login) are served stale here for up to
+# user_cache_ttl_seconds.
+_user_cache = TTLCache(ttl_seconds=get_settings().user_cache_ttl_seconds)
+
+
+def invalidate_user_cache(user_id: Optional[str] = None):
+    """
+    Drop cached user responses after a write. With a user_id, only the responses
+    that include that user are dropped; use it for in-place changes that can't
+    move the user between pages or role lists.
+    """
+    if user_id is None:
+        _user_cache.clear()
+        return
+    marker = user_id.encode()
+    _user_cache.evict(lambda body: marker in body)
+
 
 # Response models
 class UserResponse(BaseModel):
@@ -32,6 +59,28 @@ class UserResponse(BaseModel):
     updated_at: datetime
     last_login: Optional[datetime] = None
 
+# Aggregation stage shaping stored users into the UserResponse layout on the
+# MongoDB side, so reads never hydrate documents or fetch the password hash
+_USER_LIST_PROJECTION = {
+    "$project": {
+        "_id": 0,
+        "id": {"$toString": "$_id"},
+        "organisation": 1,
+        "employment_type": 1,
+        "name": 1,
+        "designation": 1,
+        "email": 1,
+        "phone": {"$ifNull": ["$phone", None]},
+        "notes": {"$ifNull": ["$notes", None]},
+        "username": {"$ifNull": ["$username", None]},
+        "roles": 1,
+        "is_active": 1,
+        "created_at": 1,
+        "updated_at": 1,
+        "last_login": {"$ifNull": ["$last_login", None]}
+    }
+}
+
 # Request models
 class UserCreate(BaseModel):
     organisation: str = "TNIFMC"
@@ -58,62 +107,60 @@ class UserUpdate(BaseModel):
     roles: Optional[List[UserRole]] = None
     is_active: Optional[bool] = None
 
-@user_router.get("/", response_model=List[UserResponse])
+@user_router.get("/", responses={200: {"model": List[UserResponse]}})
 async def get_all_users(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000)
 ):
     """Get all users"""
     try:
-        users = await User.find_all().skip(skip).limit(limit).to_list()
-        return [
-            UserResponse(
-                id=str(user.id),
-                organisation=user.organisation,
-                employment_type=user.employment_type,
-                name=user.name,
-                designation=user.designation,
-                email=user.email,
-                phone=user.phone,
-                notes=user.notes,
-                username=user.username,
-                roles=user.roles,
-                is_active=user.is_active,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-                last_login=user.last_login
-            ) for user in users
-        ]
+        cache_key = ("list", skip, limit)
+        body = _user_cache.get(cache_key)
+        if body is None:
+            users = await User.aggregate([
+                {"$skip": skip},
+                {"$limit": limit},
+                _USER_LIST_PROJECTION
+            ]).to_list(length=limit)
+            body = json_dumps(users)
+            _user_cache.set(cache_key, body)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching users: {str(e)}")
 
+@user_router.get("/stream", responses={200: {"content": {"application/x-ndjson": {}}}})
+async def stream_users():
+    """Stream every user as newline-delimited JSON (for bulk export)"""
+
+    async def generate():
+        async for user in User.aggregate([_USER_LIST_PROJECTION]):
+            yield json_dumps(user) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
 @user_router.get("/{user_id}", response_model=UserResponse)
 async def get_user(user_id: str):
     """Get a specific user"""
     try:
-        if not PydanticObjectId.is_valid(user_id):
+        if not _is_object_id(user_id):
             raise HTTPException(status_code=400, detail="Invalid user ID format")
+        
+        cache_key = ("user", user_id)
+        body = _user_cache.get(cache_key)
+        if body is not None:
+            return Response(content=body, media_type="application/json")
             
-        user = await User.get(PydanticObjectId(user_id))
-        if not user:
+        docs = await User.aggregate([
+            {"$match": {"_id": ObjectId(user_id)}},
+            {"$limit": 1},
+            _USER_LIST_PROJECTION
+        ]).to_list(length=1)
+        if not docs:
             raise HTTPException(status_code=404, detail="User not found")
         
-        return UserResponse(
-            id=str(user.id),
-            organisation=user.organisation,
-            employment_type=user.employment_type,
-            name=user.name,
-            designation=user.designation,
-            email=user.email,
-            phone=user.phone,
-            notes=user.notes,
-            username=user.username,
-            roles=user.roles,
-            is_active=user.is_active,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            last_login=user.last_login
-        )
+        body = json_dumps(docs[0])
+        _user_cache.set(cache_key, body)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching user: {str(e)}")
 
@@ -121,19 +168,21 @@ async def get_user(user_id: str):
 async def update_user(user_id: str, update_data: UserUpdate):
     """Update a user"""
     try:
-        if not PydanticObjectId.is_valid(user_id):
+        if not _is_object_id(user_id):
             raise HTTPException(status_code=400, detail="Invalid user ID format")
             
-        user = await User.get(PydanticObjectId(user_id))
+        user = await User.get(ObjectId(user_id))
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
-        update_dict = update_data.dict(exclude_unset=True)
+        update_dict = update_data.model_dump(exclude_unset=True)
         if update_dict:
             for field, value in update_dict.items():
                 setattr(user, field, value)
-            user.updated_at = datetime.utcnow()
+            user.updated_at = utcnow()
             await user.save()
+            invalidate_user_cache()
+            evict_user_sessions(user_id)
         
         return {"message": "User updated successfully", "id": str(user.id)}
     except Exception as e:
@@ -143,14 +192,16 @@ async def update_user(user_id: str, update_data: UserUpdate):
 async def delete_user(user_id: str):
     """Delete a user"""
     try:
-        if not PydanticObjectId.is_valid(user_id):
+        if not _is_object_id(user_id):
             raise HTTPException(status_code=400, detail="Invalid user ID format")
             
-        user = await User.get(PydanticObjectId(user_id))
+        user = await User.get(ObjectId(user_id))
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
         await user.delete()
+        invalidate_user_cache()
+        evict_user_sessions(user_id)
         return {"message": "User deleted successfully", "id": user_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting user: {str(e)}")
@@ -159,35 +210,27 @@ async def delete_user(user_id: str):
 async def create_user(user_data: UserCreate):
     """Create a new user"""
     try:
-        user = User(**user_data.dict())
+        user = User(**user_data.model_dump())
         await user.save()
+        invalidate_user_cache()
         return {"message": "User created successfully", "id": str(user.id)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating user: {str(e)}")
 
-@user_router.get("/role/{role}", response_model=List[UserResponse])
+@user_router.get("/role/{role}", responses={200: {"model": List[UserResponse]}})
 async def get_users_by_role(role: UserRole):
     """Get users by role"""
     try:
-        users = await User.find({"roles": role}).to_list()
-        return [
-            UserResponse(
-                id=str(user.id),
-                organisation=user.organisation,
-                employment_type=user.employment_type,
-                name=user.name,
-                designation=user.designation,
-                email=user.email,
-                phone=user.phone,
-                notes=user.notes,
-                username=user.username,
-                roles=user.roles,
-                is_active=user.is_active,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-                last_login=user.last_login
-            ) for user in users
-        ]
+        cache_key = ("role", role)
+        body = _user_cache.get(cache_key)
+        if body is None:
+            users = await User.aggregate([
+                {"$match": {"roles": role.value}},
+                _USER_LIST_PROJECTION
+            ]).to_list()
+            body = json_dumps(users)
+            _user_cache.set(cache_key, body)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching users by role: {str(e)}")
 
@@ -205,18 +248,20 @@ class ChangePasswordRequest(BaseModel):
 async def set_user_password(user_id: str, password_data: SetPasswordRequest):
     """Set password for a user (admin function)"""
     try:
-        if not PydanticObjectId.is_valid(user_id):
+        if not _is_object_id(user_id):
             raise HTTPException(status_code=400, detail="Invalid user ID format")
             
-        user = await User.get(PydanticObjectId(user_id))
+        user = await User.get(ObjectId(user_id))
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
         # Hash the new password
-        password_hash = pwd_context.hash(password_data.password)
+        password_hash = await hash_password(password_data.password)
         user.password_hash = password_hash
-        user.updated_at = datetime.utcnow()
+        user.updated_at = utcnow()
         await user.save()
+        invalidate_user_cache(user_id)
+        evict_user_sessions(user_id)
         
         return {"message": "Password set successfully", "id": str(user.id)}
     except Exception as e:
@@ -227,22 +272,26 @@ async def set_user_password(user_id: str, password_data: SetPasswordRequest):
 async def change_user_password(user_id: str, password_data: ChangePasswordRequest):
     """Change password for a user (requires current password)"""
     try:
-        if not PydanticObjectId.is_valid(user_id):
+        if not _is_object_id(user_id):
             raise HTTPException(status_code=400, detail="Invalid user ID format")
             
-        user = await User.get(PydanticObjectId(user_id))
+        user = await User.get(ObjectId(user_id))
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
         # Verify current password
-        if not user.password_hash or not pwd_context.verify(password_data.current_password, user.password_hash):
+        if not user.password_hash or not await verify_password(
+            password_data.current_password, user.password_hash
+        ):
             raise HTTPException(status_code=401, detail="Current password is incorrect")
         
         # Hash the new password
-        password_hash = pwd_context.hash(password_data.new_password)
+        password_hash = await hash_password(password_data.new_password)
         user.password_hash = password_hash
-        user.updated_at = datetime.utcnow()
+        user.updated_at = utcnow()
         await user.save()
+        invalidate_user_cache(user_id)
+        evict_user_sessions(user_id)
         
         return {"message": "Password changed successfully", "id": str(user.id)}
     except Exception as e:
@@ -253,10 +302,10 @@ async def change_user_password(user_id: str, password_data: ChangePasswordReques
 async def check_user_has_password(user_id: str):
     """Check if user has a password set"""
     try:
-        if not PydanticObjectId.is_valid(user_id):
+        if not _is_object_id(user_id):
             raise HTTPException(status_code=400, detail="Invalid user ID format")
             
-        user = await User.get(PydanticObjectId(user_id))
+        user = await User.get(ObjectId(user_id))
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
         
@@ -3,10 +3,12 @@ Contact model for Lead Management System
 Based on rearrangedContacts.json structure using MongoDB with Beanie ODM
 """
 
+import pymongo
 from beanie import Document
-from pydantic import Field, EmailStr
+from pydantic import ConfigDict, Field, EmailStr
 from typing import Optional
 from datetime import datetime
+from app.utils.clock import utcnow
 
 
 class Contact(Document):
@@ -27,8 +29,8 @@ class Contact(Document):
     status: Optional[str] = Field("Active", description="Contact status (Active, Inactive, etc.)")
     
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     
     class Settings:
         name = "contacts"
@@ -36,12 +38,19 @@ class Contact(Document):
             "organisation",
             "name",
             "email",
-            [("organisation", 1), ("name", 1)]  # Compound index
+            [("organisation", 1), ("name", 1)],  # Compound index
+            [("status", 1), ("organisation", 1)],
+            [("country_location", 1), ("organisation", 1)],
+            # Word search over the fields the contact search box matches
+            pymongo.IndexModel(
+                [("name", pymongo.TEXT), ("organisation", pymongo.TEXT), ("email", pymongo.TEXT)],
+                name="contact_text_search"
+            )
         ]
     
-    class Config:
-        validate_by_name = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "organisation": "Abu Dhabi Investment Council",
                 "name": "Sinha MK",
@@ -52,6 +61,7 @@ class Contact(Document):
                 "country_location": "UAE"
             }
         }
+    )
     
     def __repr__(self):
         return f"<Contact(id={self.id}, name='{self.name}', organisation='{self.organisation}')>"
\ No newline at end of file
@@ -22,7 +22,16 @@ db = Database()
 async def connect_to_mongo():
     """Create database connection"""
     try:
-        db.client = AsyncIOMotorClient(settings.mongodb_url)
+        # Keep a warm pool so bursts don't wait on new connection handshakes
+        db.client = AsyncIOMotorClient(
+            settings.mongodb_url,
+            maxPoolSize=settings.mongodb_max_pool_size,
+            minPoolSize=settings.mongodb_min_pool_size,
+            maxIdleTimeMS=settings.mongodb_max_idle_time_ms,
+            serverSelectionTimeoutMS=settings.mongodb_server_selection_timeout_ms,
+            compressors=settings.mongodb_compressors,
+            tz_aware=True  # Stored datetimes are UTC; read them back as aware values
+        )
         db.database = db.client[settings.database_name]
         logger.info(f"Connected to MongoDB at {settings.mongodb_url}")
         
@@ -4,9 +4,10 @@ Based on summary_FR.json structure using MongoDB with Beanie ODM
 """
 
 from beanie import Document
-from pydantic import Field
+from pydantic import ConfigDict, Field
 from typing import Optional
 from datetime import datetime
+from app.utils.clock import utcnow
 from enum import Enum
 
 
@@ -58,8 +59,8 @@ class Fundraising(Document):
     contact_id: Optional[str] = Field(None, description="Reference to contact document")
     
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     
     class Settings:
         name = "fundraising"
@@ -69,12 +70,14 @@ class Fundraising(Document):
             "investor_type",
             "responsibility_tnifmc",
             "contact_id",
-            [("organisation", 1), ("status_open_closed", 1)]
+            [("organisation", 1), ("status_open_closed", 1)],
+            [("status_open_closed", 1), ("created_at", -1)],  # Status filter, newest first
+            [("responsibility_tnifmc", 1), ("created_at", -1)]  # Owner filter, newest first
         ]
     
-    class Config:
-        validate_by_name = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "Status_Open__Closed": "Open",
                 "Date_of_first_meeting__call": "2024-03-10T00:00:00Z",
@@ -88,6 +91,7 @@ class Fundraising(Document):
                 "Current_Status": "Need to send contribution Agreement - Received Rs 5 Cr LOI"
             }
         }
+    )
     
     def __repr__(self):
         return f"<Fundraising(id={self.id}, organisation='{self.organisation}', status='{self.status_open_closed}')>"
\ No newline at end of file
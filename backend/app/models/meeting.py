@@ -3,9 +3,11 @@ Meeting model for fundraising campaigns with audio recording capabilities
 """
 
 from beanie import Document
-from pydantic import Field, BaseModel
+from pydantic import ConfigDict, Field, BaseModel
 from typing import Optional, List
 from datetime import datetime
+from app.utils.clock import utcnow
+from app.models.trusted import construct_trusted, interned
 from enum import Enum
 
 
@@ -36,6 +38,8 @@ class AudioProcessingStatus(str, Enum):
 
 class MeetingAttendee(BaseModel):
     """Meeting attendee information"""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     designation: Optional[str] = None
     organisation: str
@@ -49,7 +53,7 @@ class AudioRecording(BaseModel):
     original_filename: str
     file_size: int
     duration_seconds: Optional[float] = None
-    upload_timestamp: datetime = Field(default_factory=datetime.utcnow)
+    upload_timestamp: datetime = Field(default_factory=utcnow)
     processing_status: AudioProcessingStatus = AudioProcessingStatus.NOT_STARTED
     transcript: Optional[str] = None
     transcript_summary: Optional[str] = None
@@ -98,8 +102,8 @@ class Meeting(Document):
 
     # Metadata
     created_by: str = Field(..., description="User ID who created the meeting")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     class Settings:
         name = "meetings"
@@ -114,9 +118,9 @@ class Meeting(Document):
             [("status", 1), ("scheduled_date", 1)]  # For upcoming meetings
         ]
 
-    class Config:
-        validate_by_name = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "title": "Initial Investment Discussion with IOB",
                 "meeting_type": "Initial Meeting",
@@ -144,6 +148,21 @@ class Meeting(Document):
                 "created_by": "60f1b2b3c4d5e6f7g8h9i0j3"
             }
         }
+    )
+
+    @classmethod
+    def from_mongo(cls, doc: dict) -> "Meeting":
+        """Nested attendees and the recording are constructed too, so they serialize as models"""
+        doc = dict(doc)
+        attendees = doc.get("attendees")
+        if attendees:
+            doc["attendees"] = [construct_trusted(MeetingAttendee, a) for a in attendees]
+        recording = doc.get("audio_recording")
+        if recording:
+            doc["audio_recording"] = construct_trusted(AudioRecording, recording)
+        if "tnifmc_representatives" in doc:
+            doc["tnifmc_representatives"] = interned(doc["tnifmc_representatives"])
+        return construct_trusted(cls, doc)
 
     def __repr__(self):
         return f"<Meeting(id={self.id}, title='{self.title}', type='{self.meeting_type}', status='{self.status}')>"
\ No newline at end of file
@@ -4,9 +4,11 @@ Using MongoDB with Beanie ODM
 """
 
 from beanie import Document
-from pydantic import Field
+from pydantic import ConfigDict, Field
 from typing import Optional
 from datetime import datetime
+from app.utils.clock import utcnow
+from app.models.trusted import construct_trusted
 from enum import Enum
 
 
@@ -49,8 +51,8 @@ class Opportunity(Document):
     actual_close_date: Optional[datetime] = Field(None, description="Actual closure date")
     
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     
     class Settings:
         name = "opportunities"
@@ -59,11 +61,13 @@ class Opportunity(Document):
             "status",
             "priority", 
             "assigned_to",
-            "contact_id"
+            "contact_id",
+            [("assigned_to", 1), ("status", 1), ("target_close_date", 1)],  # Assignee pipeline by close date
+            [("organisation", 1), ("status", 1)]
         ]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Investment Opportunity - XYZ Bank",
                 "organisation": "XYZ Bank",
@@ -73,6 +77,11 @@ class Opportunity(Document):
                 "priority": "High"
             }
         }
+    )
+    
+    @classmethod
+    def from_mongo(cls, doc: dict) -> "Opportunity":
+        return construct_trusted(cls, doc)
     
     def __repr__(self):
         return f"<Opportunity(id={self.id}, title='{self.title}', status='{self.status}')>"
\ No newline at end of file
@@ -4,9 +4,11 @@ Represents organizations that contacts belong to
 """
 
 from beanie import Document
-from pydantic import Field
+from pydantic import ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
+from app.utils.clock import utcnow
+from app.models.trusted import construct_trusted, interned
 from enum import Enum
 
 
@@ -69,8 +71,8 @@ class Organization(Document):
     tags: List[str] = Field(default=[], description="Organization tags")
     
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     
     class Settings:
         name = "organizations"
@@ -82,9 +84,9 @@ class Organization(Document):
             [("name", 1), ("industry", 1)]  # Compound index
         ]
     
-    class Config:
-        validate_by_name = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "name": "Abu Dhabi Investment Council",
                 "industry": "Sovereign Wealth Funds",
@@ -101,6 +103,14 @@ class Organization(Document):
                 "priority": "High"
             }
         }
+    )
+    
+    @classmethod
+    def from_mongo(cls, doc: dict) -> "Organization":
+        """Tags repeat across organizations, so rows share interned copies"""
+        if "tags" in doc:
+            doc = {**doc, "tags": interned(doc["tags"])}
+        return construct_trusted(cls, doc)
     
     def __repr__(self):
         return f"<Organization(id={self.id}, name='{self.name}', industry='{self.industry}')>"
\ No newline at end of file
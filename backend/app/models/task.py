@@ -4,9 +4,11 @@ Using MongoDB with Beanie ODM
 """
 
 from beanie import Document
-from pydantic import Field
+from pydantic import ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
+from app.utils.clock import utcnow
+from app.models.trusted import construct_trusted, interned
 from enum import Enum
 
 
@@ -66,22 +68,22 @@ class Task(Document):
     notes: Optional[str] = Field(None, description="Additional notes")
     
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     
     class Settings:
         name = "tasks"
         indexes = [
             "status",
-            "assigned_to",
             "task_type",
             "contact_id",
             "opportunity_id",
-            "due_date"
+            "due_date",
+            [("assigned_to", 1), ("status", 1), ("due_date", 1)]  # Assignee task lists
         ]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Follow up call with XYZ Bank",
                 "description": "Discuss investment terms and next steps",
@@ -92,6 +94,14 @@ class Task(Document):
                 "priority": "High"
             }
         }
+    )
+    
+    @classmethod
+    def from_mongo(cls, doc: dict) -> "Task":
+        """Tags repeat across tasks, so rows share interned copies"""
+        if "tags" in doc:
+            doc = {**doc, "tags": interned(doc["tags"])}
+        return construct_trusted(cls, doc)
     
     def __repr__(self):
         return f"<Task(id={self.id}, title='{self.title}', status='{self.status}')>"
\ No newline at end of file
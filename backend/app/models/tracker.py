@@ -4,9 +4,11 @@ Using MongoDB with Beanie ODM
 """
 
 from beanie import Document
-from pydantic import Field
+from pydantic import ConfigDict, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
+from app.utils.clock import utcnow
+from app.models.trusted import construct_trusted
 from enum import Enum
 
 
@@ -26,6 +28,8 @@ class Tracker(Document):
     
     title: str = Field(..., description="Tracker title")
     category: str = Field(..., description="Tracker category")
+    tracker_type: Optional[TrackerType] = Field(None, description="Type of tracked entity")
+    entity_id: Optional[str] = Field(None, description="ID of the tracked entity")
     
     # Flexible data storage
     data: Dict[str, Any] = Field(default={}, description="Flexible tracking data")
@@ -42,8 +46,8 @@ class Tracker(Document):
     notes: Optional[str] = Field(None, description="Additional notes")
     
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     
     class Settings:
         name = "tracker"
@@ -53,11 +57,15 @@ class Tracker(Document):
             "contact_id",
             "fundraising_id",
             "opportunity_id",
-            "user_id"
+            "user_id",
+            "tracker_type",
+            "entity_id",
+            [("entity_id", 1), ("tracker_type", 1)],  # Compound index
+            [("category", 1), ("status", 1), ("updated_at", -1)]  # Recent activity per category
         ]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Meeting Follow-up Tracker",
                 "category": "Meeting",
@@ -69,6 +77,11 @@ class Tracker(Document):
                 "status": "Active"
             }
         }
+    )
+    
+    @classmethod
+    def from_mongo(cls, doc: dict) -> "Tracker":
+        return construct_trusted(cls, doc)
     
     def __repr__(self):
         return f"<Tracker(id={self.id}, title='{self.title}', category='{self.category}')>"
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+Validation-free construction of models from trusted MongoDB documents
+"""
+
+import sys
+from enum import Enum
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type, TypeVar, get_args, get_origin
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class _ModelKeys(NamedTuple):
+    """Stored keys of a model, resolved once per class"""
+    keys: Tuple[str, ...]
+    enums: Tuple[Tuple[str, Type[Enum], Callable[[Any], Enum], bool], ...]  # (key, enum class, value lookup, is_list)
+
+
+_MODEL_KEYS: Dict[type, _ModelKeys] = {}
+
+
+def _enum_type(annotation: Any) -> Optional[Type[Enum]]:
+    for candidate in (annotation, *get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, Enum):
+            return candidate
+    return None
+
+
+def _model_keys(model: type) -> _ModelKeys:
+    """Resolve a model's stored keys and enum fields on first use"""
+    resolved = _MODEL_KEYS.get(model)
+    if resolved is None:
+        keys = []
+        enums = []
+        for name, info in model.model_fields.items():
+            # Interned so lookups against BSON-decoded keys hit the hash fast path
+            key = sys.intern(info.alias or name)
+            keys.append(key)
+            enum_cls = _enum_type(info.annotation)
+            if enum_cls is not None:
+                # Bound dict lookup skips Enum.__call__ for every stored value
+                lookup = enum_cls._value2member_map_.__getitem__
+                enums.append((key, enum_cls, lookup, get_origin(info.annotation) is list))
+        resolved = _MODEL_KEYS[model] = _ModelKeys(tuple(keys), tuple(enums))
+    return resolved
+
+
+def interned(values: Optional[List[str]]) -> Optional[List[str]]:
+    """Intern repeated short strings (tags, names) so rows share one object each"""
+    if not values:
+        return values
+    return [sys.intern(value) for value in values]
+
+
+def construct_trusted(model: Type[ModelT], doc: Dict[str, Any]) -> ModelT:
+    """Build a model from data that was validated before it was stored.
+
+    Skips the validator chain via ``model_construct``; only enum values are
+    restored so serialization matches a validated instance. Never use this
+    for request data.
+    """
+    resolved = _model_keys(model)
+    values = {key: doc[key] for key in resolved.keys if key in doc}
+    for key, enum_cls, lookup, is_list in resolved.enums:
+        value = values.get(key)
+        if value is None:
+            continue
+        if is_list:
+            values[key] = [v if isinstance(v, enum_cls) else lookup(v) for v in value]
+        elif not isinstance(value, enum_cls):
+            values[key] = lookup(value)
+    return model.model_construct(**values)
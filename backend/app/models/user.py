@@ -4,9 +4,11 @@ Based on users.json structure using MongoDB with Beanie ODM
 """
 
 from beanie import Document
-from pydantic import Field, EmailStr
+from pydantic import ConfigDict, EmailStr, Field
 from typing import Optional, List
 from datetime import datetime
+from app.utils.clock import utcnow
+from app.models.trusted import construct_trusted
 from enum import Enum
 
 
@@ -43,8 +45,8 @@ class User(Document):
     is_active: bool = Field(default=True, description="User active status")
     
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     last_login: Optional[datetime] = Field(None)
     
     class Settings:
@@ -54,11 +56,13 @@ class User(Document):
             "username", 
             "designation",
             "employment_type",
-            "is_active"
+            "is_active",
+            "roles",
+            [("is_active", 1), ("roles", 1)]  # Active users by role
         ]
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "organisation": "TNIFMC",
                 "employment_type": "Employee",
@@ -70,6 +74,11 @@ class User(Document):
                 "roles": ["user"]
             }
         }
+    )
+    
+    @classmethod
+    def from_mongo(cls, doc: dict) -> "User":
+        return construct_trusted(cls, doc)
     
     def __repr__(self):
         return f"<User(id={self.id}, name='{self.name}', email='{self.email}')>"
\ No newline at end of file
@@ -4,64 +4,230 @@ Audio Processing Service - Handles audio-to-text conversion and AI analysis
 
 import os
 import openai
-from typing import Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 import asyncio
-from datetime import datetime
-import json
-import re
+import aiofiles
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from app.utils.cache import TTLCache
+from app.utils.clock import utcnow
+from app.utils.config import get_settings
+import orjson
+from pydantic import BaseModel, ValidationError
 
 from app.models.meeting import Meeting, AudioProcessingStatus
+from app.services.openai_limiter import with_retry
+
+settings = get_settings()
+
+# Keys can differ per request, but every client shares one keep-alive pool.
+# Reads keep the SDK's 600s budget for long Whisper uploads; only connecting
+# and waiting for a pooled connection fail fast
+_http_client = openai.DefaultAsyncHttpxClient(timeout=openai.Timeout(600, connect=5, pool=10))
+
+
+# Low-temperature analysis results keyed by a hash of the full request, so
+# reprocessing or retrying the same transcript does not pay for inference again
+_completion_cache = TTLCache(ttl_seconds=settings.ai_cache_ttl_seconds, maxsize=256)
+
+
+# Prompts are built once at import. Static instructions come first and the
+# variable transcript last, so repeated calls share a cacheable prompt prefix
+_ANALYZE_SYSTEM = """You are an expert business analyst specializing in investment meetings. Provide structured, actionable insights from meeting transcripts.
+
+Analyze the meeting transcript you are given and respond with a JSON object only, with the following structure:
+{
+    "summary": "Brief 2-3 sentence summary of the meeting",
+    "key_points": ["List of 3-5 key discussion points"],
+    "action_items": ["List of specific action items, commitments and follow-up tasks mentioned or implied"],
+    "decisions": ["List of key decisions, agreements and commitments made"],
+    "sentiment": "Overall sentiment (positive/negative/neutral)",
+    "topics_discussed": ["Main topics covered"],
+    "participants_mood": "Assessment of participants' engagement and mood",
+    "follow_up_needed": "What follow-up actions are needed",
+    "risks_concerns": ["Any risks or concerns mentioned"],
+    "opportunities": ["Investment or business opportunities identified"]
+}
+
+Focus on investment/fundraising context. Be specific and actionable."""
+
+_ANALYZE_TMPL = """TRANSCRIPT:
+{transcript}"""
+
+_INSIGHTS_SYSTEM = "You are an expert business consultant providing insights from meeting transcripts. Provide a detailed, actionable response."
+
+# Several prompts are usually run against one meeting, so the transcript
+# goes ahead of the prompt to keep it inside the shared prefix
+_INSIGHTS_TMPL = """TRANSCRIPT:
+{transcript}
+
+Based on the meeting transcript above, {custom_prompt}"""
+
+
+class TranscriptAnalysis(BaseModel):
+    """Shape of the JSON object the analysis prompt asks for"""
+    summary: str
+    key_points: List[str] = []
+    action_items: List[str] = []
+    decisions: List[str] = []
+    sentiment: Optional[str] = None
+    topics_discussed: List[str] = []
+    participants_mood: Optional[str] = None
+    follow_up_needed: Optional[str] = None
+    risks_concerns: List[str] = []
+    opportunities: List[str] = []
+
+
+def _parse_analysis(content: str) -> Dict:
+    return TranscriptAnalysis.model_validate_json(content).model_dump()
+
+
+_default_client: Optional[openai.AsyncOpenAI] = None
+
+# Clients re-keyed for request-supplied keys, least recently used first
+_keyed_clients: "OrderedDict[str, openai.AsyncOpenAI]" = OrderedDict()
+_MAX_KEYED_CLIENTS = 32
+
+
+def _openai_client(api_key: Optional[str] = None) -> openai.AsyncOpenAI:
+    """Return the shared client, re-keyed (without a new pool) when a request supplies its own key"""
+    global _default_client
+    if _default_client is None:
+        # Built from the environment only, never from a caller's key. Without
+        # OPENAI_API_KEY it carries a placeholder; _require_key stops keyless
+        # requests before it is used, and keyed requests only derive from it.
+        # Retries are handled by with_retry so they go through the shared limiter
+        _default_client = openai.AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY") or "unset",
+            http_client=_http_client,
+            max_retries=0
+        )
+    if not api_key:
+        return _default_client
+    client = _keyed_clients.pop(api_key, None) or _default_client.with_options(api_key=api_key)
+    _keyed_clients[api_key] = client
+    if len(_keyed_clients) > _MAX_KEYED_CLIENTS:
+        _keyed_clients.popitem(last=False)
+    return client
+
+
+async def close_http_client():
+    """Close the shared OpenAI connection pool; called on application shutdown"""
+    await _http_client.aclose()
 
 
 class AudioProcessingService:
     """Service for processing audio recordings with AI"""
 
     def __init__(self, api_key: Optional[str] = None):
-        # Allow per-request override via provided api_key; fallback to env var
-        effective_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not effective_key:
-            # Defer error until first API call to allow endpoints to validate
-            pass
-        self.openai_client = openai.OpenAI(api_key=effective_key) if effective_key else openai.OpenAI()
+        # Allow per-request override via provided api_key; fallback to env var.
+        # The client is resolved on first API call so a missing key fails there
+        self._api_key = api_key
         self.audio_dir = "uploads/audio"
 
-    async def process_audio_recording(self, meeting_id: str) -> Dict:
+    @property
+    def openai_client(self) -> openai.AsyncOpenAI:
+        self._require_key()
+        return _openai_client(self._api_key)
+
+    def _require_key(self) -> None:
+        """Fail fast when neither a request key nor OPENAI_API_KEY is available"""
+        if not self._api_key and not os.getenv("OPENAI_API_KEY"):
+            raise RuntimeError("OpenAI API key not configured. Provide X-OpenAI-API-Key header or set OPENAI_API_KEY.")
+
+    async def _cached_completion(
+        self,
+        parse: Callable[[str], Any],
+        model: str,
+        messages: List[Dict],
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[Dict] = None
+    ) -> Any:
+        """
+        Run a chat completion, reusing an earlier answer to the identical request.
+        Only answers that parse are cached, so a parse error can be retried.
+        """
+        # The effective key is part of the hash so one caller's paid answer is
+        # never served to another account
+        api_key = self._api_key or os.getenv("OPENAI_API_KEY") or ""
+        request = orjson.dumps(
+            [api_key, model, messages, temperature, max_tokens, response_format],
+            option=orjson.OPT_SORT_KEYS
+        )
+        cache_key = hashlib.sha256(request).hexdigest()
+        result = _completion_cache.get(cache_key)
+        if result is None:
+            extra = {"response_format": response_format} if response_format else {}
+            response = await with_retry(
+                self.openai_client.chat.completions.create,
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **extra
+            )
+            result = parse(response.choices[0].message.content)
+            _completion_cache.set(cache_key, result)
+        return result
+
+    async def process_audio_recording(
+        self,
+        meeting_id: str,
+        meeting: Optional[Meeting] = None,
+        mark_processing: bool = True
+    ) -> Dict:
         """
         Process audio recording: transcribe and analyze with AI
-        Returns processing results
+        Returns processing results; pass an already loaded meeting to skip the lookup,
+        and mark_processing=False when the caller has already set the PROCESSING status
         """
 
         # Get meeting
-        meeting = await Meeting.get(meeting_id)
+        if meeting is None:
+            meeting = await Meeting.get(meeting_id)
         if not meeting or not meeting.audio_recording:
             raise ValueError("Meeting or audio recording not found")
 
         try:
-            # Update status to processing
-            meeting.audio_recording.processing_status = AudioProcessingStatus.PROCESSING
-            await meeting.save()
-
-            # Transcribe audio
-            audio_path = os.path.join(self.audio_dir, meeting.audio_recording.filename)
-            transcript = await self._transcribe_audio(audio_path)
+            filename = meeting.audio_recording.filename
+            audio_path = os.path.join(self.audio_dir, filename)
+            if not os.path.exists(audio_path):
+                raise FileNotFoundError(f"Audio file not found: {audio_path}")
+            async with aiofiles.open(audio_path, "rb") as audio_file:
+                audio_bytes = await audio_file.read()
+
+            if mark_processing:
+                # Mark as processing while the transcription request is in flight;
+                # a targeted $set instead of rewriting the whole document
+                saved, transcript = await asyncio.gather(
+                    meeting.set({"audio_recording.processing_status": AudioProcessingStatus.PROCESSING}),
+                    self._transcribe_audio(audio_bytes, filename),
+                    return_exceptions=True
+                )
+                # Let both settle before raising so the status writes can't race
+                for result in (saved, transcript):
+                    if isinstance(result, BaseException):
+                        raise result
+            else:
+                transcript = await self._transcribe_audio(audio_bytes, filename)
 
             # Analyze transcript with AI
             analysis = await self._analyze_transcript(transcript)
 
-            # Update meeting with results
-            meeting.audio_recording.transcript = transcript
-            meeting.audio_recording.transcript_summary = analysis.get("summary")
-            meeting.audio_recording.ai_insights = analysis
-            meeting.audio_recording.processing_status = AudioProcessingStatus.COMPLETED
-
-            # Update meeting with AI-generated content
-            meeting.ai_summary = analysis.get("summary")
-            meeting.ai_key_points = analysis.get("key_points", [])
-            meeting.ai_action_items = analysis.get("action_items", [])
-            meeting.ai_sentiment = analysis.get("sentiment")
-
-            meeting.updated_at = datetime.utcnow()
-            await meeting.save()
+            # Write only the fields produced by processing
+            await meeting.set({
+                "audio_recording.transcript": transcript,
+                "audio_recording.transcript_summary": analysis.get("summary"),
+                "audio_recording.ai_insights": analysis,
+                "audio_recording.processing_status": AudioProcessingStatus.COMPLETED,
+                "ai_summary": analysis.get("summary"),
+                "ai_key_points": analysis.get("key_points", []),
+                "ai_action_items": analysis.get("action_items", []),
+                "ai_sentiment": analysis.get("sentiment"),
+                "updated_at": utcnow()
+            })
 
             return {
                 "status": "success",
@@ -71,116 +237,74 @@ class AudioProcessingService:
 
         except Exception as e:
             # Update status to failed
-            meeting.audio_recording.processing_status = AudioProcessingStatus.FAILED
-            await meeting.save()
+            await meeting.set({"audio_recording.processing_status": AudioProcessingStatus.FAILED})
 
             raise Exception(f"Audio processing failed: {str(e)}")
 
-    async def _transcribe_audio(self, audio_path: str) -> str:
-        """Transcribe audio file using OpenAI Whisper"""
-
-        if not os.path.exists(audio_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
-
-        # Validate API key availability
-        if not getattr(self.openai_client, "api_key", None) and not os.getenv("OPENAI_API_KEY"):
-            raise RuntimeError("OpenAI API key not configured. Provide X-OpenAI-API-Key header or set OPENAI_API_KEY.")
-
-        with open(audio_path, "rb") as audio_file:
-            transcript = self.openai_client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                response_format="text"
-            )
+    async def _transcribe_audio(self, audio_bytes: bytes, filename: str) -> str:
+        """Transcribe audio using OpenAI Whisper; the filename tells it the format"""
+
+        self._require_key()
+        # A timed-out upload is not retried: it would resend the whole recording
+        transcript = await with_retry(
+            self.openai_client.audio.transcriptions.create,
+            retry_timeouts=False,
+            model="whisper-1",
+            file=(filename, audio_bytes),
+            response_format="text"
+        )
 
         return transcript.strip()
 
     async def _analyze_transcript(self, transcript: str) -> Dict:
         """Analyze transcript using GPT for insights and tasks"""
 
-        prompt = f"""
-        Analyze the following meeting transcript and provide a structured analysis:
-
-        TRANSCRIPT:
-        {transcript}
-
-        Please provide a JSON response with the following structure:
-        {{
-            "summary": "Brief 2-3 sentence summary of the meeting",
-            "key_points": ["List of 3-5 key discussion points"],
-            "action_items": ["List of specific action items mentioned or implied"],
-            "sentiment": "Overall sentiment (positive/negative/neutral)",
-            "topics_discussed": ["Main topics covered"],
-            "participants_mood": "Assessment of participants' engagement and mood",
-            "follow_up_needed": "What follow-up actions are needed",
-            "risks_concerns": ["Any risks or concerns mentioned"],
-            "opportunities": ["Investment or business opportunities identified"]
-        }}
-
-        Focus on investment/fundraising context. Be specific and actionable.
-        """
-
-        # Validate API key availability
-        if not getattr(self.openai_client, "api_key", None) and not os.getenv("OPENAI_API_KEY"):
-            raise RuntimeError("OpenAI API key not configured. Provide X-OpenAI-API-Key header or set OPENAI_API_KEY.")
+        self._require_key()
+        prompt = _ANALYZE_TMPL.format_map({"transcript": transcript})
 
-        response = self.openai_client.chat.completions.create(
-            model="gpt-4",
+        request = dict(
+            parse=_parse_analysis,
+            model=settings.ai_analysis_model,
             messages=[
-                {"role": "system", "content": "You are an expert business analyst specializing in investment meetings. Provide structured, actionable insights from meeting transcripts."},
+                {"role": "system", "content": _ANALYZE_SYSTEM},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.3,
-            max_tokens=1000
+            max_tokens=1000,
+            response_format={"type": "json_object"}
         )
-
-        # Parse JSON response
         try:
-            analysis_text = response.choices[0].message.content.strip()
-            # Remove markdown code blocks if present
-            analysis_text = re.sub(r'```json\s*|\s*```', '', analysis_text)
-            analysis = json.loads(analysis_text)
-            return analysis
-        except json.JSONDecodeError as e:
-            # Fallback analysis if JSON parsing fails
-            return {
-                "summary": "Meeting transcript analysis completed.",
-                "key_points": ["Transcript processed successfully"],
-                "action_items": ["Review AI analysis for detailed insights"],
-                "sentiment": "neutral",
-                "topics_discussed": ["Meeting content analyzed"],
-                "participants_mood": "Professional",
-                "follow_up_needed": "Review detailed analysis",
-                "risks_concerns": [],
-                "opportunities": ["AI-powered insights generated"]
-            }
+            return await self._cached_completion(**request)
+        except ValidationError:
+            # JSON mode guarantees syntax, not our fields; retry once on the
+            # stronger model before failing
+            return await self._cached_completion(**{**request, "model": settings.ai_analysis_fallback_model})
 
-    async def generate_meeting_insights(self, meeting_id: str, custom_prompt: str) -> Dict:
-        """Generate custom insights from meeting transcript using custom prompt"""
+    async def _insights_messages(self, meeting_id: str, custom_prompt: str) -> List[Dict]:
+        """Build the chat messages for a custom prompt over a meeting transcript"""
 
         meeting = await Meeting.get(meeting_id)
         if not meeting or not meeting.audio_recording or not meeting.audio_recording.transcript:
             raise ValueError("Meeting transcript not available")
 
-        prompt = f"""
-        Based on the following meeting transcript, {custom_prompt}
-
-        TRANSCRIPT:
-        {meeting.audio_recording.transcript}
-
-        Provide a detailed, actionable response.
-        """
+        self._require_key()
+        prompt = _INSIGHTS_TMPL.format_map({
+            "custom_prompt": custom_prompt,
+            "transcript": meeting.audio_recording.transcript
+        })
+        return [
+            {"role": "system", "content": _INSIGHTS_SYSTEM},
+            {"role": "user", "content": prompt}
+        ]
 
-        # Validate API key availability
-        if not getattr(self.openai_client, "api_key", None) and not os.getenv("OPENAI_API_KEY"):
-            raise RuntimeError("OpenAI API key not configured. Provide X-OpenAI-API-Key header or set OPENAI_API_KEY.")
+    async def generate_meeting_insights(self, meeting_id: str, custom_prompt: str) -> Dict:
+        """Generate custom insights from meeting transcript using custom prompt"""
 
-        response = self.openai_client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "You are an expert business consultant providing insights from meeting transcripts."},
-                {"role": "user", "content": prompt}
-            ],
+        messages = await self._insights_messages(meeting_id, custom_prompt)
+        response = await with_retry(
+            self.openai_client.chat.completions.create,
+            model=settings.ai_insights_model,
+            messages=messages,
             temperature=0.7,
             max_tokens=1500
         )
@@ -188,66 +312,47 @@ class AudioProcessingService:
         return {
             "custom_prompt": custom_prompt,
             "response": response.choices[0].message.content.strip(),
-            "generated_at": datetime.utcnow()
+            "generated_at": utcnow()
         }
 
-    async def extract_action_items(self, transcript: str) -> List[str]:
-        """Extract specific action items from transcript"""
-
-        prompt = f"""
-        Extract all specific action items, commitments, and follow-up tasks from this meeting transcript.
-        Return them as a numbered list of specific, actionable items.
-
-        TRANSCRIPT:
-        {transcript}
+    async def stream_meeting_insights(self, meeting_id: str, custom_prompt: str) -> AsyncIterator[str]:
+        """
+        Start a streamed custom-prompt completion and return its text deltas.
+        Lookup and API errors are raised here, before any output is produced.
         """
 
-        # Validate API key availability
-        if not getattr(self.openai_client, "api_key", None) and not os.getenv("OPENAI_API_KEY"):
-            raise RuntimeError("OpenAI API key not configured. Provide X-OpenAI-API-Key header or set OPENAI_API_KEY.")
-
-        response = self.openai_client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "Extract action items and commitments from meeting transcripts."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2,
-            max_tokens=500
+        messages = await self._insights_messages(meeting_id, custom_prompt)
+        stream = await with_retry(
+            self.openai_client.chat.completions.create,
+            model=settings.ai_insights_model,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=1500,
+            stream=True
         )
 
-        action_items = response.choices[0].message.content.strip()
-        # Split into list items
-        items = [item.strip('- •123456789. ') for item in action_items.split('\n') if item.strip()]
-        return [item for item in items if item]
+        async def deltas():
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
 
-    async def summarize_key_decisions(self, transcript: str) -> List[str]:
-        """Extract key decisions made during the meeting"""
+        return deltas()
 
-        prompt = f"""
-        Identify and list all key decisions, agreements, and commitments made during this meeting.
-        Focus on concrete decisions and outcomes.
+    async def extract_action_items(self, transcript: str) -> List[str]:
+        """Extract specific action items from transcript"""
 
-        TRANSCRIPT:
-        {transcript}
+        # Served from the combined analysis; repeat calls hit the completion cache
+        analysis = await self._analyze_transcript(transcript)
+        return [item for item in analysis.get("action_items", []) if item]
 
-        Return as a numbered list of specific decisions.
-        """
+    async def summarize_key_decisions(self, transcript: str) -> List[str]:
+        """Extract key decisions made during the meeting"""
 
-        # Validate API key availability
-        if not getattr(self.openai_client, "api_key", None) and not os.getenv("OPENAI_API_KEY"):
-            raise RuntimeError("OpenAI API key not configured. Provide X-OpenAI-API-Key header or set OPENAI_API_KEY.")
+        analysis = await self._analyze_transcript(transcript)
+        return [item for item in analysis.get("decisions", []) if item]
 
-        response = self.openai_client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "Identify key decisions and agreements from meeting transcripts."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2,
-            max_tokens=500
-        )
 
-        decisions = response.choices[0].message.content.strip()
-        items = [item.strip('- •123456789. ') for item in decisions.split('\n') if item.strip()]
-        return [item for item in items if item]
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_audio_service() -> AudioProcessingService:
+    """Shared service for requests that rely on OPENAI_API_KEY"""
+    return AudioProcessingService()
@@ -3,6 +3,7 @@ Contact Service - Business logic for contact management
 Following SOLID principles with dependency injection
 """
 
+import re
 from typing import List, Optional
 from app.models.contact import Contact
 from beanie import PydanticObjectId
@@ -43,16 +44,27 @@ class ContactService:
             return True
         return False
     
-    async def search_contacts(self, query: str) -> List[Contact]:
-        """Search contacts by name, email, or company"""
-        return await Contact.find({
+    async def search_contacts(self, query: str, limit: int = 50) -> List[Contact]:
+        """
+        Search contacts by name, organisation, or email.
+        Whole-word hits come from the text index; only when they don't fill the
+        page does an (unindexed) substring scan add partial names and emails.
+        """
+        contacts = await Contact.find({"$text": {"$search": query}}).limit(limit).to_list(length=limit)
+        if len(contacts) >= limit:
+            return contacts
+
+        remaining = limit - len(contacts)
+        pattern = {"$regex": re.escape(query), "$options": "i"}
+        contacts += await Contact.find({
+            "_id": {"$nin": [contact.id for contact in contacts]},
             "$or": [
-                {"first_name": {"$regex": query, "$options": "i"}},
-                {"last_name": {"$regex": query, "$options": "i"}},
-                {"email": {"$regex": query, "$options": "i"}},
-                {"company": {"$regex": query, "$options": "i"}}
+                {"name": pattern},
+                {"organisation": pattern},
+                {"email": pattern}
             ]
-        }).to_list()
+        }).limit(remaining).to_list(length=remaining)
+        return contacts
     
     async def get_contacts_by_status(self, status: str) -> List[Contact]:
         """Get contacts by status"""
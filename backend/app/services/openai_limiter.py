@@ -0,0 +1,103 @@
+"""
+Client-side throttling and retries for OpenAI API calls
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+import openai
+
+from app.utils.config import get_settings
+
+T = TypeVar("T")
+
+settings = get_settings()
+
+_RETRYABLE = (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError)
+
+
+class RateLimiter:
+    """Caps in-flight requests and spaces request starts to a requests-per-minute budget.
+
+    The budget is a leaky bucket refilled at ``requests_per_minute / 60``
+    per second, with room for one second of burst. State is process-local,
+    so the effective limit scales with the number of workers.
+    """
+
+    def __init__(self, max_concurrency: int, requests_per_minute: int):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._rate = requests_per_minute / 60
+        self._capacity = max(1.0, self._rate)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def _acquire_token(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self._semaphore.acquire()
+        try:
+            await self._acquire_token()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._semaphore.release()
+
+
+rate_limiter = RateLimiter(
+    max_concurrency=settings.openai_max_concurrency,
+    requests_per_minute=settings.openai_requests_per_minute
+)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds the API asked us to wait, if it said"""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+async def with_retry(
+    call: Callable[..., Awaitable[T]],
+    *args: Any,
+    retry_timeouts: bool = True,
+    **kwargs: Any
+) -> T:
+    """
+    Run an OpenAI call under the shared rate limiter, backing off on 429s and timeouts.
+    Pass retry_timeouts=False for uploads, where a retry repeats (and may re-bill) the
+    whole request. Retrying stops once openai_retry_budget_seconds would be exceeded.
+    """
+    attempts = settings.openai_max_attempts
+    deadline = time.monotonic() + settings.openai_retry_budget_seconds
+    for attempt in range(1, attempts + 1):
+        try:
+            async with rate_limiter:
+                return await call(*args, **kwargs)
+        except _RETRYABLE as e:
+            if attempt == attempts or (isinstance(e, openai.APITimeoutError) and not retry_timeouts):
+                raise
+            delay = _retry_after(e) or min(2 ** attempt, 30)
+            # Jitter so throttled callers don't all come back in the same instant
+            delay += random.uniform(0, delay / 2)
+            if time.monotonic() + delay > deadline:
+                raise
+            await asyncio.sleep(delay)
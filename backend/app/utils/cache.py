@@ -0,0 +1,47 @@
+"""
+In-memory cache for read-heavy endpoints
+"""
+
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Process-local key/value cache with a fixed time-to-live per entry.
+
+    Entries are not shared between worker processes, so keep the TTL short
+    enough that cross-worker staleness is acceptable.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full"""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            # Every entry shares one TTL, so insertion order is expiry order
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def evict(self, predicate: Callable[[Any], bool]) -> None:
+        """Drop every entry whose value matches the predicate"""
+        for key in [key for key, (_, value) in self._entries.items() if predicate(value)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        self._entries.clear()
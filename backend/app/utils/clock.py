@@ -0,0 +1,10 @@
+"""
+Time helpers for the Lead Management System
+"""
+
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime"""
+    return datetime.now(timezone.utc)
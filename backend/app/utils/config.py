@@ -2,9 +2,8 @@
 Configuration settings for the Lead Management System
 """
 
+from functools import lru_cache
 from pydantic_settings import BaseSettings
-from typing import Optional
-import os
 
 
 class Settings(BaseSettings):
@@ -13,11 +12,33 @@ class Settings(BaseSettings):
     # MongoDB settings
     mongodb_url: str = "mongodb://localhost:27017"
     database_name: str = "trackon_lead_management"
+    mongodb_max_pool_size: int = 200
+    mongodb_min_pool_size: int = 20
+    mongodb_max_idle_time_ms: int = 60000
+    mongodb_server_selection_timeout_ms: int = 2000
+    mongodb_compressors: str = "zstd,zlib"
     
     # JWT settings
     secret_key: str = "your-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    password_hash_workers: int = 4
+    
+    # Cache settings
+    user_cache_ttl_seconds: int = 30
+    session_cache_ttl_seconds: int = 60
+    ai_cache_ttl_seconds: int = 60 * 60 * 24 * 30
+    
+    # OpenAI models
+    ai_analysis_model: str = "gpt-4o-mini"
+    ai_analysis_fallback_model: str = "gpt-4o"
+    ai_insights_model: str = "gpt-4o-mini"
+    
+    # OpenAI throttling
+    openai_max_concurrency: int = 20
+    openai_requests_per_minute: int = 500
+    openai_max_attempts: int = 5
+    openai_retry_budget_seconds: float = 60
     
     # CORS settings
     cors_origins: list = ["http://localhost:3000", "http://127.0.0.1:3000", "http://localhost:3001", "http://127.0.0.1:3001"]
@@ -30,6 +51,7 @@ class Settings(BaseSettings):
         env_file = ".env"
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings"""
+    """Get application settings, read from the environment and .env once per process"""
     return Settings()
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+Password hashing for the Lead Management System
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from passlib.context import CryptContext
+
+from app.utils.config import get_settings
+
+# Cost pinned at 10 (2^10 rounds); each step up doubles hash/verify latency
+pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=10, deprecated="auto")
+
+# bcrypt is CPU-bound but releases the GIL, so a small thread pool keeps it
+# off the event loop and runs hashes in parallel. The pool is per worker
+# process; size it with the number of uvicorn workers in mind
+_BCRYPT_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Create the bcrypt worker pool on first use rather than at import time"""
+    global _BCRYPT_POOL
+    if _BCRYPT_POOL is None:
+        _BCRYPT_POOL = ThreadPoolExecutor(
+            max_workers=get_settings().password_hash_workers,
+            thread_name_prefix="bcrypt"
+        )
+    return _BCRYPT_POOL
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(password: str, password_hash: str) -> bool:
+    return pwd_context.verify(password, password_hash)
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password in the bcrypt worker pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_pool(), _hash, password)
+
+
+async def verify_password(password: str, password_hash: str) -> bool:
+    """Check a password against its hash in the bcrypt worker pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_pool(), _verify, password, password_hash)
+
+
+def shutdown_password_pool() -> None:
+    """Stop the bcrypt workers; called on application shutdown"""
+    global _BCRYPT_POOL
+    if _BCRYPT_POOL is not None:
+        _BCRYPT_POOL.shutdown(wait=False, cancel_futures=True)
+        _BCRYPT_POOL = None
@@ -0,0 +1,28 @@
+"""
+Response classes for the Lead Management System
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def json_dumps(content: Any) -> bytes:
+    """Encode content with orjson.
+
+    Anything orjson cannot encode natively (ObjectId, PydanticObjectId) is
+    rendered with ``str``; naive datetimes are emitted as UTC.
+    """
+    return orjson.dumps(
+        content,
+        default=str,
+        option=orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+    )
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
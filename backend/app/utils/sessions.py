@@ -0,0 +1,39 @@
+"""
+Cache of users resolved from bearer tokens
+"""
+
+import time
+from typing import Optional
+
+from app.models.user import User
+from app.utils.cache import TTLCache
+from app.utils.config import get_settings
+
+# Users resolved from bearer tokens as (user, token expiry), so repeat requests
+# skip signature verification and the user lookup. Entries are per process:
+# writes through this worker evict the affected user at once, but a user
+# updated, deactivated or deleted through another worker stays authenticated
+# here for up to session_cache_ttl_seconds.
+_session_cache = TTLCache(ttl_seconds=get_settings().session_cache_ttl_seconds, maxsize=10_000)
+
+
+def cached_session_user(token: str) -> Optional[User]:
+    """Return the user a still-valid token was last resolved to, if cached"""
+    entry = _session_cache.get(token)
+    if entry is None:
+        return None
+    user, expires_at = entry
+    if expires_at is not None and expires_at <= time.time():
+        return None
+    # Each request gets its own copy so handlers can't alter the shared entry
+    return user.model_copy(deep=True)
+
+
+def cache_session_user(token: str, user: User, expires_at: Optional[float]):
+    """Remember the user a verified token resolved to until the token or cache entry expires"""
+    _session_cache.set(token, (user.model_copy(deep=True), expires_at))
+
+
+def evict_user_sessions(user_id: str):
+    """Drop cached token lookups for one user after that user changes"""
+    _session_cache.evict(lambda entry: str(entry[0].id) == user_id)
@@ -18,6 +18,9 @@ from app.controllers.organization_controller import organization_router
 from app.controllers.meeting_controller import meeting_router
 from app.models.database import init_db, close_mongo_connection
 from app.utils.config import get_settings
+from app.services.audio_processing_service import close_http_client
+from app.utils.passwords import shutdown_password_pool
+from app.utils.responses import ORJSONResponse
 
 settings = get_settings()
 
@@ -29,12 +32,15 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     await close_mongo_connection()
+    shutdown_password_pool()
+    await close_http_client()
 
 app = FastAPI(
     title="TNIFMC Lead Management System",
     description="Investment tracking and lead management system with SOLID principles and MongoDB",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
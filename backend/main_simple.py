@@ -11,6 +11,7 @@ from app.controllers.contact_controller import contact_router
 from app.controllers.fundraising_controller import fundraising_router
 from app.controllers.user_controller import user_router
 from app.utils.config import get_settings
+from app.utils.responses import ORJSONResponse
 
 settings = get_settings()
 
@@ -29,7 +30,8 @@ app = FastAPI(
     title="TNIFMC Lead Management System",
     description="Investment tracking and lead management system",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -0,0 +1,40 @@
+"""
+Shared test fixtures: a throwaway MongoDB database and an HTTP client for the app
+"""
+
+import pytest
+import pytest_asyncio
+from beanie import init_beanie
+from httpx import ASGITransport, AsyncClient
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.models.contact import Contact
+from app.models.task import Task
+from app.models.tracker import Tracker
+from app.utils.config import get_settings
+from main import app
+
+
+@pytest_asyncio.fixture
+async def database():
+    """Beanie bound to a scratch database, dropped after each test; skips without MongoDB"""
+    settings = get_settings()
+    mongo = AsyncIOMotorClient(settings.mongodb_url, serverSelectionTimeoutMS=1000, tz_aware=True)
+    try:
+        await mongo.admin.command("ping")
+    except Exception:
+        mongo.close()
+        pytest.skip(f"MongoDB not reachable at {settings.mongodb_url}")
+
+    database = mongo[f"{settings.database_name}_test"]
+    await init_beanie(database=database, document_models=[Contact, Task, Tracker])
+    yield database
+    await mongo.drop_database(database.name)
+    mongo.close()
+
+
+@pytest_asyncio.fixture
+async def client(database):
+    """HTTP client for the app; the lifespan is skipped since the database fixture initializes Beanie"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http_client:
+        yield http_client
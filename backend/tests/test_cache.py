@@ -0,0 +1,41 @@
+"""
+TTLCache tests
+"""
+
+from app.utils import cache
+from app.utils.cache import TTLCache
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    ttl_cache = TTLCache(ttl_seconds=30)
+    ttl_cache.set("key", "value")
+
+    now[0] += 30
+    assert ttl_cache.get("key") == "value"
+
+    now[0] += 1
+    assert ttl_cache.get("key") is None
+
+
+def test_oldest_entry_is_dropped_when_full():
+    ttl_cache = TTLCache(ttl_seconds=30, maxsize=2)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.set("c", 3)
+
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get("b") == 2
+    assert ttl_cache.get("c") == 3
+
+
+def test_evict_drops_only_matching_entries():
+    ttl_cache = TTLCache(ttl_seconds=30)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+
+    ttl_cache.evict(lambda value: value == 1)
+
+    assert ttl_cache.get("a") is None
+    assert ttl_cache.get("b") == 2
@@ -0,0 +1,24 @@
+"""
+Contact search tests
+"""
+
+from app.models.contact import Contact
+from app.services.contact_service import ContactService
+
+
+async def test_search_keeps_partial_matches_alongside_word_hits(database):
+    word_hit = await Contact(name="Sinha MK", organisation="Abu Dhabi Investment Council").insert()
+    partial_hit = await Contact(name="A Kumar", organisation="ADIC", email="asinha@adic.ae").insert()
+    await Contact(name="Jane Doe", organisation="Other Fund").insert()
+
+    results = await ContactService().search_contacts("sinha")
+
+    assert [contact.id for contact in results] == [word_hit.id, partial_hit.id]
+
+
+async def test_search_finds_partial_names(database):
+    contact = await Contact(name="Sinha MK", organisation="Abu Dhabi Investment Council").insert()
+
+    results = await ContactService().search_contacts("Sin")
+
+    assert [result.id for result in results] == [contact.id]
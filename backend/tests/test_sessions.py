@@ -0,0 +1,69 @@
+"""
+Session token cache tests
+"""
+
+import time
+
+import pytest
+from bson import ObjectId
+
+from app.models.user import User
+from app.utils import sessions
+
+
+@pytest.fixture(autouse=True)
+def empty_session_cache():
+    sessions._session_cache.clear()
+    yield
+    sessions._session_cache.clear()
+
+
+def make_user(name: str) -> User:
+    return User.from_mongo({
+        "_id": ObjectId(),
+        "employment_type": "Employee",
+        "name": name,
+        "designation": "Analyst",
+        "email": f"{name.lower()}@tnifmc.com"
+    })
+
+
+def test_cached_user_is_a_copy():
+    user = make_user("Asha")
+    sessions.cache_session_user("token", user, time.time() + 60)
+
+    cached = sessions.cached_session_user("token")
+    cached.name = "Changed"
+
+    assert cached.id == user.id
+    assert sessions.cached_session_user("token").name == "Asha"
+
+
+def test_expired_token_is_not_served():
+    sessions.cache_session_user("token", make_user("Asha"), time.time() - 1)
+
+    assert sessions.cached_session_user("token") is None
+
+
+def test_cache_entry_expires_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(sessions._session_cache, "ttl_seconds", 60)
+    monkeypatch.setattr("app.utils.cache.time.monotonic", lambda: now[0])
+    sessions.cache_session_user("token", make_user("Asha"), None)
+
+    now[0] += 61
+
+    assert sessions.cached_session_user("token") is None
+
+
+def test_evict_user_sessions_drops_only_that_user():
+    asha, ravi = make_user("Asha"), make_user("Ravi")
+    sessions.cache_session_user("asha-1", asha, None)
+    sessions.cache_session_user("asha-2", asha, None)
+    sessions.cache_session_user("ravi-1", ravi, None)
+
+    sessions.evict_user_sessions(str(asha.id))
+
+    assert sessions.cached_session_user("asha-1") is None
+    assert sessions.cached_session_user("asha-2") is None
+    assert sessions.cached_session_user("ravi-1").id == ravi.id
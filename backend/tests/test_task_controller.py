@@ -0,0 +1,30 @@
+"""
+Task endpoint tests
+"""
+
+from app.models.task import Task
+
+TASKS_URL = "/api/tasks/tasks"
+
+
+async def test_create_task_without_assignee_is_rejected(client):
+    response = await client.post(f"{TASKS_URL}/", json={"title": "Unassigned"})
+
+    assert response.status_code == 422
+    assert await Task.count() == 0
+
+
+async def test_bulk_update_rejects_null_required_fields(client):
+    created = await client.post(f"{TASKS_URL}/", json={"title": "Call XYZ Bank", "assigned_to": "user_1"})
+    task_id = created.json()["id"]
+
+    response = await client.put(f"{TASKS_URL}/bulk", json=[{"id": task_id, "patch": {"assigned_to": None}}])
+
+    assert response.status_code == 422
+    assert (await Task.get(task_id)).assigned_to == "user_1"
+
+
+async def test_list_rejects_skip_with_after_id(client):
+    response = await client.get(f"{TASKS_URL}/", params={"skip": 10, "after_id": "0123456789abcdef01234567"})
+
+    assert response.status_code == 400
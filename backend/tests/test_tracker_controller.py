@@ -0,0 +1,65 @@
+"""
+Tracker endpoint tests
+"""
+
+from app.models.tracker import Tracker
+
+TRACKER_URL = "/api/tracker/tracker"
+
+
+async def test_create_tracker_entry(client):
+    response = await client.post(f"{TRACKER_URL}/", json={
+        "title": "Meeting Follow-up Tracker",
+        "category": "Meeting",
+        "tracker_type": "Meeting",
+        "data": {"action_items": ["Send proposal"]}
+    })
+
+    assert response.status_code == 200
+    tracker = await Tracker.get(response.json()["id"])
+    assert tracker.title == "Meeting Follow-up Tracker"
+    assert tracker.category == "Meeting"
+    assert tracker.data == {"action_items": ["Send proposal"]}
+    assert tracker.status == "Active"
+
+
+async def test_create_tracker_entry_without_category_is_rejected(client):
+    response = await client.post(f"{TRACKER_URL}/", json={"title": "No category"})
+
+    assert response.status_code == 422
+    assert await Tracker.count() == 0
+
+
+async def test_bulk_update_rejects_null_required_fields(client):
+    created = await client.post(f"{TRACKER_URL}/", json={"title": "Keep me", "category": "Meeting"})
+    tracker_id = created.json()["id"]
+
+    response = await client.put(f"{TRACKER_URL}/bulk", json=[{"id": tracker_id, "patch": {"title": None}}])
+
+    assert response.status_code == 422
+    tracker = await Tracker.get(tracker_id)
+    assert tracker.title == "Keep me"
+
+
+async def test_bulk_update_reports_matched_and_modified(client):
+    created = await client.post(f"{TRACKER_URL}/", json={"title": "Before", "category": "Meeting"})
+    tracker_id = created.json()["id"]
+
+    response = await client.put(f"{TRACKER_URL}/bulk", json=[
+        {"id": tracker_id, "patch": {"title": "After"}},
+        {"id": "0123456789abcdef01234567", "patch": {"title": "Missing"}}
+    ])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["submitted"] == 2
+    assert body["matched"] == 1
+    assert body["modified"] == 1
+    assert (await Tracker.get(tracker_id)).title == "After"
+
+
+async def test_bulk_create_rejects_oversized_batches(client):
+    response = await client.post(f"{TRACKER_URL}/bulk", json=[{"title": "Entry", "category": "Meeting"}] * 501)
+
+    assert response.status_code == 422
+    assert await Tracker.count() == 0
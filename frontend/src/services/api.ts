@@ -317,6 +317,10 @@ async function apiRequest<T>(endpoint: string, options: RequestInit = {}): Promi
       throw new Error(`HTTP error! status: ${response.status}`);
     }
     
+    if (response.status === 204) {
+      return undefined as T;
+    }
+    
     return await response.json();
   } catch (error) {
     console.error(`API request failed: ${endpoint}`, error);
@@ -378,8 +382,8 @@ export const organizationsApi = {
       method: 'PUT',
       body: JSON.stringify(organization),
     }),
-  delete: (id: string): Promise<{message: string}> =>
-    apiRequest<{message: string}>(`/api/organizations/${id}`, {
+  delete: (id: string): Promise<void> =>
+    apiRequest<void>(`/api/organizations/${id}`, {
       method: 'DELETE',
     }),
 };